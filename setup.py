@@ -20,7 +20,7 @@ setup(
         "pre-commit>=2.17.0",
         "pylint>=2.7.2",
         "pytest>=6.2.2",
-        "scipy>=1.5.4",
+        "scipy>=1.7.0",
     ],
     extras_require={
         "tests": [
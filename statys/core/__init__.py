@@ -1,4 +1,9 @@
 """A core package for all common statys modules.
 """
 
-from statys.core.distribution import Distribution
+from statys.core.distribution import (
+    ColumnarDistribution,
+    Distribution,
+    StreamingDistribution,
+)
+from statys.core.pairwise import ControlResult, IncrementalPairwise, PairwiseResult
@@ -1,12 +1,16 @@
 """Distribution-related definitions.
 """
 
-from typing import Any, Dict
+import struct
+import zipfile
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 import statys.utils.exception as e
 from statys.utils import logging
+from statys.utils.cache import MeasureCache
+from statys.utils.moments import Moments
 
 logger = logging.get_logger(__name__)
 
@@ -17,6 +21,8 @@ class Distribution:
 
     """
 
+    _cache = None
+
     def __init__(self, *args) -> None:
         """Initialization method."""
 
@@ -41,7 +47,23 @@ class Distribution:
 
         """
 
-        return str(self.__dict__)
+        return str(dict(self.attrs))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets an attribute, invalidating the cache if an argument is changed.
+
+        Args:
+            name: Name of the attribute.
+            value: Value of the attribute.
+
+        """
+
+        if self._cache is not None and not name.startswith("_"):
+            self._cache.clear()
+
+            value = _freeze(value)
+
+        super().__setattr__(name, value)
 
     @property
     def attrs(self) -> Dict[str, Any]:
@@ -52,4 +74,486 @@ class Distribution:
 
         """
 
-        return self.__dict__.items()
+        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}.items()
+
+    @property
+    def cache(self) -> Optional[MeasureCache]:
+        """Cache of measures' outputs (None if it is disabled)."""
+
+        return self._cache
+
+    def enable_cache(
+        self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = 268435456
+    ) -> None:
+        """Enables the cache of measures' outputs.
+
+        Note that arguments are frozen into private read-only copies (read-only memory
+        maps are only viewed), so they can only be changed by re-assigning them, which
+        automatically invalidates the cache. Caller's arrays are left untouched.
+
+        Args:
+            max_entries: Maximum amount of cached outputs.
+            max_bytes: Maximum amount of memory used by cached outputs.
+
+        """
+
+        for attr, value in list(self.attrs):
+            super().__setattr__(attr, _freeze(value))
+
+        self._cache = MeasureCache(max_entries, max_bytes)
+
+    def disable_cache(self) -> None:
+        """Disables the cache of measures' outputs."""
+
+        self._cache = None
+
+    @classmethod
+    def from_npy(
+        cls, paths: Union[str, List[str]], mmap: Optional[bool] = True
+    ) -> "Distribution":
+        """Creates a distribution from .npy files, one argument per file.
+
+        Args:
+            paths: Path (or list of paths) to the .npy files.
+            mmap: Whether arrays should be memory-mapped instead of loaded into memory.
+
+        Returns:
+            (Distribution): Distribution backed by the files' arrays.
+
+        """
+
+        if isinstance(paths, str):
+            paths = [paths]
+
+        mmap_mode = "r" if mmap else None
+
+        return cls(*[np.load(path, mmap_mode=mmap_mode) for path in paths])
+
+    @classmethod
+    def from_npz(
+        cls,
+        path: str,
+        keys: Optional[List[str]] = None,
+        mmap: Optional[bool] = True,
+    ) -> "Distribution":
+        """Creates a distribution from a .npz file, one argument per stored array.
+
+        Note that only uncompressed archives (`np.savez`) can be memory-mapped, while
+        arrays from compressed archives (`np.savez_compressed`) are loaded into memory.
+
+        Args:
+            path: Path to the .npz file.
+            keys: Arrays to be used as arguments (defaults to all, in archive order).
+            mmap: Whether arrays should be memory-mapped instead of loaded into memory.
+
+        Returns:
+            (Distribution): Distribution backed by the file's arrays.
+
+        """
+
+        with zipfile.ZipFile(path) as archive:
+            members = {
+                info.filename[: -len(".npy")]: info
+                for info in archive.infolist()
+                if info.filename.endswith(".npy")
+            }
+
+        if keys is None:
+            keys = list(members.keys())
+
+        args = []
+        for key in keys:
+            if key not in members:
+                raise e.ValueError(f"`{key}` should be an array stored in `{path}`")
+
+            info = members[key]
+
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                args.append(_mmap_npz_member(path, info))
+
+            else:
+                with np.load(path) as archive:
+                    args.append(archive[key])
+
+        return cls(*args)
+
+
+def _freeze(value: Union[List, np.ndarray]) -> np.ndarray:
+    """Freezes an argument into a private read-only array.
+
+    Read-only memory maps are only viewed, as nobody can write through them,
+    while any other argument is copied, so writes to the original are not seen.
+
+    Args:
+        value: Argument to be frozen.
+
+    Returns:
+        (np.ndarray): Read-only array.
+
+    """
+
+    if isinstance(value, np.memmap) and value.mode == "r":
+        value = value.view()
+
+    else:
+        value = np.array(value, copy=True)
+
+    value.flags.writeable = False
+
+    return value
+
+
+def _mmap_npz_member(path: str, info: zipfile.ZipInfo) -> np.memmap:
+    """Memory-maps an uncompressed array stored inside a .npz file.
+
+    Args:
+        path: Path to the .npz file.
+        info: Information about the archive's member.
+
+    Returns:
+        (np.memmap): Memory-mapped array.
+
+    """
+
+    with open(path, "rb") as f:
+        # Skips the member's local header, which holds variable-sized fields
+        f.seek(info.header_offset)
+        header = f.read(30)
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        f.seek(info.header_offset + 30 + name_length + extra_length)
+
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+
+        offset = f.tell()
+
+    order = "F" if fortran_order else "C"
+
+    return np.memmap(
+        path, dtype=dtype, mode="r", offset=offset, shape=shape, order=order
+    )
+
+
+class ColumnarDistribution:
+    """A Distribution that converts its arguments only once into a single contiguous buffer.
+
+    Arguments with the same shape are stacked into a `(n_args, *shape)` matrix, while
+    ragged arguments are concatenated into a flat buffer indexed by an offsets array.
+    Every argument is then exposed as a zero-copy view of the buffer.
+
+    """
+
+    __slots__ = ("_data", "_offsets", "_shapes", "_cache")
+
+    def __init__(self, *args, dtype: Optional[np.dtype] = np.float64) -> None:
+        """Initialization method.
+
+        Args:
+            dtype: Data type of the underlying buffer.
+
+        """
+
+        logger.info("Initializing class with %d arguments ...", len(args))
+
+        arrays = []
+        for i, arg in enumerate(args):
+            if not isinstance(arg, (list, np.ndarray)):
+                raise e.TypeError(f"`arg{i}` should be a list or np.ndarray")
+
+            arrays.append(np.asarray(arg, dtype=dtype))
+
+        self._shapes = tuple(array.shape for array in arrays)
+
+        if len(set(self._shapes)) <= 1:
+            # Arguments share the same shape, hence they can be stacked
+            self._data = np.ascontiguousarray(np.stack(arrays)) if arrays else None
+            self._offsets = None
+
+        else:
+            # Ragged arguments are concatenated and indexed by their offsets
+            sizes = [array.size for array in arrays]
+
+            self._offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+            self._offsets[1:] = np.cumsum(sizes)
+
+            self._data = np.empty(self._offsets[-1], dtype=dtype)
+            for i, array in enumerate(arrays):
+                self._data[self._offsets[i] : self._offsets[i + 1]] = array.ravel()
+
+        self._cache = None
+
+        logger.debug("%s", self)
+        logger.info("Class initialized.")
+
+    def __repr__(self) -> str:
+        """Class' string representation.
+
+        Returns:
+            (str): String representation.
+
+        """
+
+        return str(dict(self.attrs))
+
+    def __len__(self) -> int:
+        """Amount of arguments.
+
+        Returns:
+            (int): Number of arguments.
+
+        """
+
+        return len(self._shapes)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """Gathers a zero-copy view of an argument.
+
+        Args:
+            index: Index of the argument.
+
+        Returns:
+            (np.ndarray): View of the argument.
+
+        """
+
+        if not -len(self) <= index < len(self):
+            raise e.ValueError(f"`index` should be smaller than {len(self)}")
+
+        index %= len(self)
+
+        if self._offsets is None:
+            return self._data[index]
+
+        start, end = self._offsets[index], self._offsets[index + 1]
+
+        return self._data[start:end].reshape(self._shapes[index])
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """Gathers an argument by its `argN` name.
+
+        Args:
+            name: Name of the argument.
+
+        Returns:
+            (np.ndarray): View of the argument.
+
+        """
+
+        if name.startswith("arg") and name[3:].isdigit() and int(name[3:]) < len(self):
+            return self[int(name[3:])]
+
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    @property
+    def data(self) -> np.ndarray:
+        """Underlying buffer, i.e., a stacked matrix or a flat ragged buffer."""
+
+        return self._data
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Offsets of each argument in the flat buffer (None if arguments are stacked)."""
+
+        return self._offsets
+
+    @property
+    def shapes(self) -> Tuple[Tuple[int, ...], ...]:
+        """Shapes of each argument."""
+
+        return self._shapes
+
+    @property
+    def is_ragged(self) -> bool:
+        """Whether arguments have different shapes."""
+
+        return self._offsets is not None
+
+    @property
+    def attrs(self) -> List[Tuple[str, np.ndarray]]:
+        """Gathers all attributes from class.
+
+        Returns:
+            (List[Tuple[str, np.ndarray]]): Pairs of attributes' names and views.
+
+        """
+
+        return [(f"arg{i}", self[i]) for i in range(len(self))]
+
+    @property
+    def cache(self) -> Optional[MeasureCache]:
+        """Cache of measures' outputs (None if it is disabled)."""
+
+        return self._cache
+
+    def enable_cache(
+        self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = 268435456
+    ) -> None:
+        """Enables the cache of measures' outputs.
+
+        Note that the underlying buffer is frozen as read-only, so cached outputs
+        can not be outdated by in-place changes.
+
+        Args:
+            max_entries: Maximum amount of cached outputs.
+            max_bytes: Maximum amount of memory used by cached outputs.
+
+        """
+
+        if self._data is not None:
+            self._data.flags.writeable = False
+
+        self._cache = MeasureCache(max_entries, max_bytes)
+
+    def disable_cache(self) -> None:
+        """Disables the cache of measures' outputs."""
+
+        self._cache = None
+
+
+class StreamingDistribution:
+    """A Distribution whose arguments can be continuously appended to.
+
+    Every argument keeps its running moments up-to-date, which allows moment-based
+    measures to be answered in O(1) without re-scanning the data.
+
+    """
+
+    def __init__(
+        self, *args, n_args: Optional[int] = 0, keep_values: Optional[bool] = True
+    ) -> None:
+        """Initialization method.
+
+        Args:
+            n_args: Minimum amount of arguments, which are created empty if not supplied.
+            keep_values: Whether appended values should be kept (required by non-moment measures).
+
+        """
+
+        logger.info("Initializing class with %d arguments ...", max(len(args), n_args))
+
+        self.keep_values = keep_values
+
+        self._cache = None
+        self._moments = []
+        self._chunks = []
+        self._values = []
+
+        for _ in range(max(len(args), n_args)):
+            self._moments.append(Moments())
+            self._chunks.append([])
+            self._values.append(None)
+
+        for i, arg in enumerate(args):
+            if not isinstance(arg, (list, np.ndarray)):
+                raise e.TypeError(f"`arg{i}` should be a list or np.ndarray")
+
+            self.append(i, arg)
+
+        logger.debug("%s", self)
+        logger.info("Class initialized.")
+
+    def __repr__(self) -> str:
+        """Class' string representation.
+
+        Returns:
+            (str): String representation.
+
+        """
+
+        return str({f"arg{i}": m for i, m in enumerate(self._moments)})
+
+    def __len__(self) -> int:
+        """Amount of arguments.
+
+        Returns:
+            (int): Number of arguments.
+
+        """
+
+        return len(self._moments)
+
+    def append(self, arg_index: int, values: Union[float, List, np.ndarray]) -> None:
+        """Appends values to an argument and updates its running moments.
+
+        Args:
+            arg_index: Index of the argument.
+            values: Values to be appended.
+
+        """
+
+        if not 0 <= arg_index < len(self):
+            raise e.ValueError(f"`arg_index` should be between 0 and {len(self) - 1}")
+
+        values = np.asarray(values, dtype=np.float64).ravel()
+
+        self._moments[arg_index].update(values)
+
+        if self.keep_values:
+            self._chunks[arg_index].append(values)
+            self._values[arg_index] = None
+
+        if self._cache is not None:
+            self._cache.clear()
+
+    @property
+    def moments(self) -> List[Tuple[str, Moments]]:
+        """Gathers the running moments of all attributes.
+
+        Returns:
+            (List[Tuple[str, Moments]]): Pairs of attributes' names and moments.
+
+        """
+
+        return [(f"arg{i}", m) for i, m in enumerate(self._moments)]
+
+    @property
+    def attrs(self) -> List[Tuple[str, np.ndarray]]:
+        """Gathers all attributes from class.
+
+        Returns:
+            (List[Tuple[str, np.ndarray]]): Pairs of attributes' names and values.
+
+        """
+
+        if not self.keep_values:
+            raise e.ValueError(
+                "`keep_values` should be True to gather the values of the distribution"
+            )
+
+        for i, chunks in enumerate(self._chunks):
+            if self._values[i] is None:
+                # Concatenates appended chunks only once (until the next append)
+                self._values[i] = np.concatenate(chunks) if chunks else np.empty(0)
+                self._chunks[i] = [self._values[i]]
+
+        return [(f"arg{i}", v) for i, v in enumerate(self._values)]
+
+    @property
+    def cache(self) -> Optional[MeasureCache]:
+        """Cache of measures' outputs (None if it is disabled)."""
+
+        return self._cache
+
+    def enable_cache(
+        self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = 268435456
+    ) -> None:
+        """Enables the cache of measures' outputs, which is invalidated by every append.
+
+        Args:
+            max_entries: Maximum amount of cached outputs.
+            max_bytes: Maximum amount of memory used by cached outputs.
+
+        """
+
+        self._cache = MeasureCache(max_entries, max_bytes)
+
+    def disable_cache(self) -> None:
+        """Disables the cache of measures' outputs."""
+
+        self._cache = None
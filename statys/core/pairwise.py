@@ -0,0 +1,264 @@
+"""Pairwise-related definitions.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+import statys.utils.exception as e
+
+
+def calculate_hypotheses(p: np.ndarray, alpha: float) -> np.ndarray:
+    """Calculates the hypotheses of an array of p-values, following
+    `wrappers.calculate_hypothesis`, i.e., NaN p-values reject the null hypothesis.
+
+    Args:
+        p: P-values from a statistical test.
+        alpha: Significance value.
+
+    Returns:
+        (np.ndarray): 1 if hypothesis is rejected and 0 if it failed to be rejected.
+
+    """
+
+    with np.errstate(invalid="ignore"):
+        return (~(np.asarray(p) >= alpha)).astype(int)
+
+
+class PairwiseResult(NamedTuple):
+    """Dense outputs of a pairwise statistical test, where cell (i, j) holds the
+    comparison between the i-th and j-th arguments.
+
+    """
+
+    labels: np.ndarray
+    statistic: np.ndarray
+    p: np.ndarray
+    h: np.ndarray
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the dense outputs into the dictionary-based format.
+
+        Returns:
+            (Dict[str, Any]): Outputs keyed by `argi-argj`, holding (h, p) tuples.
+
+        """
+
+        output = {}
+
+        for i, attr in enumerate(self.labels):
+            for j, attr2 in enumerate(self.labels):
+                if i != j:
+                    output[f"{attr}-{attr2}"] = (int(self.h[i, j]), self.p[i, j])
+
+        return output
+
+
+class ControlResult(NamedTuple):
+    """Outputs of a statistical test between a control argument and every other argument,
+    where the i-th position holds the comparison between the control and the i-th label.
+
+    """
+
+    control: str
+    labels: np.ndarray
+    statistic: np.ndarray
+    p: np.ndarray
+    h: np.ndarray
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the outputs into the dictionary-based format.
+
+        Returns:
+            (Dict[str, Any]): Outputs keyed by `control-argj`, holding (h, p) tuples.
+
+        """
+
+        return {
+            f"{self.control}-{attr}": (int(h), p)
+            for attr, h, p in zip(self.labels, self.h, self.p)
+        }
+
+
+class IncrementalPairwise:
+    """A persistent pairwise result, which grows (or shrinks) one argument at a time.
+
+    Adding an argument only tests it against the current ones (2k tests, or k if the
+    test is symmetric), while previously computed cells are kept untouched. Matrices
+    are preallocated and their capacity is doubled whenever they are full.
+
+    """
+
+    def __init__(
+        self,
+        test: callable,
+        alpha: Optional[float] = 0.05,
+        symmetric: Optional[bool] = False,
+        mirror: Optional[callable] = None,
+        capacity: Optional[int] = 16,
+    ) -> None:
+        """Initialization method.
+
+        Args:
+            test: Pointer to a statistical test.
+            alpha: Significance value.
+            symmetric: Whether test's p-value is symmetric, i.e., only the new argument
+                against the current ones is tested and mirrored cells are filled by symmetry.
+            mirror: Pointer to a function that maps the statistic of (i, j) and the pair's
+                values into the statistic of (j, i) (statistic is kept if not supplied),
+                e.g., `mann_whitney.mirror_u` or `wilcoxon.mirror_z`.
+            capacity: Initial amount of arguments that fit into the matrices.
+
+        """
+
+        if capacity <= 0:
+            raise e.ValueError("`capacity` should be greater than 0")
+
+        self.test = test
+        self.alpha = alpha
+        self.symmetric = symmetric
+        self.mirror = mirror
+
+        self._labels = []
+        self._samples = []
+        self._count = 0
+
+        self._statistic = np.full((capacity, capacity), np.nan)
+        self._p = np.full((capacity, capacity), np.nan)
+
+    def __len__(self) -> int:
+        """Amount of arguments.
+
+        Returns:
+            (int): Number of arguments.
+
+        """
+
+        return len(self._labels)
+
+    @property
+    def capacity(self) -> int:
+        """Amount of arguments that fit into the matrices."""
+
+        return self._p.shape[0]
+
+    @property
+    def labels(self) -> List[str]:
+        """Labels of the arguments."""
+
+        return list(self._labels)
+
+    @classmethod
+    def from_distribution(
+        cls, dist: Any, test: callable, **kwargs
+    ) -> "IncrementalPairwise":
+        """Creates a pairwise result holding every argument of a distribution.
+
+        Args:
+            dist: Distribution to be analyzed.
+            test: Pointer to a statistical test.
+
+        Returns:
+            (IncrementalPairwise): Pairwise result.
+
+        """
+
+        pairwise = cls(test, **kwargs)
+
+        for (attr, value) in dist.attrs:
+            pairwise.add(value, attr)
+
+        return pairwise
+
+    def _grow(self) -> None:
+        """Doubles the capacity of the matrices, copying the computed cells."""
+
+        n, capacity = len(self), 2 * self.capacity
+
+        for name in ("_statistic", "_p"):
+            matrix = np.full((capacity, capacity), np.nan)
+            matrix[:n, :n] = getattr(self, name)[:n, :n]
+
+            setattr(self, name, matrix)
+
+    def add(self, value: np.ndarray, label: Optional[str] = None) -> str:
+        """Adds an argument, testing it against the current ones.
+
+        Args:
+            value: Values of the argument.
+            label: Label of the argument (defaults to `argN`).
+
+        Returns:
+            (str): Label of the added argument.
+
+        """
+
+        if label is None:
+            label = f"arg{self._count}"
+
+        if label in self._labels:
+            raise e.ValueError(f"`label` {label} already exists")
+
+        if len(self) == self.capacity:
+            self._grow()
+
+        value = np.asarray(value)
+        k = len(self)
+
+        for j, other in enumerate(self._samples):
+            self._statistic[k, j], self._p[k, j] = self.test(value, other)
+
+            if self.symmetric:
+                self._p[j, k] = self._p[k, j]
+                self._statistic[j, k] = (
+                    self.mirror(self._statistic[k, j], value, other)
+                    if self.mirror
+                    else self._statistic[k, j]
+                )
+
+            else:
+                self._statistic[j, k], self._p[j, k] = self.test(other, value)
+
+        self._labels.append(label)
+        self._samples.append(value)
+        self._count += 1
+
+        return label
+
+    def remove(self, label: str) -> None:
+        """Removes an argument, keeping the order and cells of the remaining ones.
+
+        Args:
+            label: Label of the argument.
+
+        """
+
+        if label not in self._labels:
+            raise e.ValueError(f"`label` {label} does not exist")
+
+        index, n = self._labels.index(label), len(self)
+
+        for matrix in (self._statistic, self._p):
+            matrix[index : n - 1, :n] = matrix[index + 1 : n, :n]
+            matrix[:n, index : n - 1] = matrix[:n, index + 1 : n]
+            matrix[n - 1, :n] = matrix[:n, n - 1] = np.nan
+
+        del self._labels[index]
+        del self._samples[index]
+
+    def result(self) -> PairwiseResult:
+        """Gathers the current dense outputs.
+
+        Returns:
+            (PairwiseResult): Outputs of the pairwise test.
+
+        """
+
+        n = len(self)
+
+        statistic, p = self._statistic[:n, :n].copy(), self._p[:n, :n].copy()
+
+        h = calculate_hypotheses(p, self.alpha)
+        np.fill_diagonal(h, 0)
+
+        return PairwiseResult(np.asarray(self._labels), statistic, p, h)
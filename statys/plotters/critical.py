@@ -3,261 +3,238 @@ by https://github.com/biolab/orange3.
 """
 
 
-from typing import Any, Dict, List, Optional, Tuple
+import io
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from matplotlib.axis import Axis
 from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 
+import statys.utils.exception as e
+from statys.plotters.layout import (
+    CriticalDifferenceLayout,
+    _get_amount_lines,
+    critical_difference_layout,
+)
 
-def _create_labels(size: Optional[int] = 1) -> List[str]:
-    """Creates a list of labels strings.
 
-    Args:
-        size: Amount of strings to be created.
-
-    Returns:
-        (List[str]): Stringed labels, e.g., x0, x1, ..., xn.
-
-    """
-
-    labels = []
-
-    for i in range(size):
-        labels.append(f"$x_{{{i}}}$")
-
-    return labels
-
-
-def _multiple_range(input_list: List[Any]) -> Tuple[Any, ...]:
-    """Performs a multiple range, used to traverse matrices.
+def _prepare_plot(width: float, height: float) -> Tuple[Figure, Axis]:
+    """Prepares the plot prior to its use.
 
     Args:
-        input_list: List to be traversed.
+        width: Width of the plot.
+        height: Height of the plot.
 
-    Yields:
-        (Tuple[Any, ...]): Iterator of tuples.
+    Returns:
+        (Tuple[Figure, Axis]): Figure and axis properties from the plot.
 
     """
 
-    length = len(input_list)
+    fig = Figure(figsize=(width, height))
 
-    if length == 0:
-        yield ()
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.set_axis_off()
 
-    else:
-        index = input_list[0]
+    ax.plot([0, 1], [0, 1], c="w")
 
-        if isinstance(index, int):
-            index = [index]
+    ax.set_xlim(0, 1)
+    ax.set_ylim(1, 0)
 
-        for a in range(*index):
-            for b in _multiple_range(input_list[1:]):
-                yield tuple([a] + list(b))
+    return fig, ax
 
 
-def _line_factoring(line: List[float], factor: float) -> List[float]:
-    """Factors a line's positioning.
+def _draw_critical_difference(
+    ranks: np.ndarray,
+    cd: float,
+    labels: Optional[List[str]] = None,
+    width: Optional[int] = 6,
+    text_spacing: Optional[int] = 2,
+    reverse: Optional[bool] = False,
+) -> Figure:
+    """Draws the critical difference diagram of a set of averaged ranks.
 
     Args:
-        line: Lines to be factored.
-        factor: Factor to use in the factoring.
+        ranks: Averaged ranks.
+        cd: Critical difference.
+        labels: List of stringed labels.
+        width: Plot's width.
+        text_spacing: Text spacing inside the plot.
+        reverse: Whether plot should use ascending or descending order.
 
     Returns:
-        (List[float]): Factored lines.
-
-    """
-
-    return [a * factor for a in line]
-
-
-def _plot_line(
-    ax: Axis,
-    input_list: List[Tuple[int, int]],
-    width_factor: float,
-    height_factor: float,
-    color: Optional[str] = "k",
-    **kwargs,
-) -> None:
-    """Plots pairs of points as lines.
-
-    Args:
-        ax: Axis to be plotted.
-        input_list: List of pairs of points.
-        width_factor: Width factor.
-        height_factor: Height factor.
-        color: Color to be plotted.
+        (Figure): Drawn figure.
 
     """
 
-    x = _line_factoring(_get_element(input_list, 0), width_factor)
-    y = _line_factoring(_get_element(input_list, 1), height_factor)
+    layout = critical_difference_layout(ranks, cd, labels, width, text_spacing, reverse)
 
-    ax.plot(x, y, color=color, **kwargs)
+    return _render_layout(layout)
 
 
-def _plot_text(
-    ax: Axis,
-    x: int,
-    y: int,
-    s: str,
-    width_factor: float,
-    height_factor: float,
-    **kwargs,
-) -> None:
-    """Plots a text on the desired position.
+def _render_layout(layout: CriticalDifferenceLayout) -> Figure:
+    """Renders the layout of a critical difference diagram, drawing every segment
+    with a single collection of lines.
 
     Args:
-        ax: Axis to be plotted.
-        x: `x` position to be plotted.
-        y: `y` position to be plotted.
-        s: String to be plotted.
-        width_factor: Width factor.
-        height_factor: Height factor.
-
-    """
-
-    ax.text(width_factor * x, height_factor * y, s, **kwargs)
-
-
-def _get_amount_lines(ranks: List[int], cd: float) -> List[Tuple[Any, ...]]:
-    """Gets the amount of possible lines to create the plot.
-
-    Args:
-        ranks: List of ranks.
-        cd: Critical difference.
+        layout: Layout of the diagram.
 
     Returns:
-        (List[Tuple[Any, ...]]): Longest possible amount of lines.
+        (Figure): Drawn figure.
 
     """
 
-    n_ranks = len(ranks)
+    fig, ax = _prepare_plot(layout.width, layout.height)
 
-    pairs = [(i, j) for i, j in _multiple_range([[n_ranks], [n_ranks]]) if j > i]
-    non_pairs = [(i, j) for i, j in pairs if abs(ranks[i] - ranks[j]) <= cd]
+    # Layouts are measured in inches, while axes are normalized between 0 and 1
+    factor = np.array([1 / layout.width, 1 / layout.height])
 
-    def get_longest(i: int, j: int, pairs: Tuple[int, int]) -> bool:
-        for k, l in pairs:
-            if (k <= i and l > j) or (k < i and l >= j):
-                return False
-
-        return True
+    ax.add_collection(
+        LineCollection(
+            layout.segments * factor,
+            linewidths=layout.linewidths,
+            colors="k",
+            capstyle="projecting",
+        )
+    )
 
-    longest = [(i, j) for i, j in non_pairs if get_longest(i, j, non_pairs)]
+    for (x, y), text, ha, va in zip(
+        layout.text_positions * factor, layout.texts, layout.text_ha, layout.text_va
+    ):
+        ax.text(x, y, text, ha=ha, va=va)
 
-    return longest
+    return fig
 
 
-def _get_element(input_list: List[Any], n: int) -> List[Any]:
-    """Gets a specific element from a list of tuples.
+def _save_figure(fig: Figure, file: Union[str, IO], fmt: str) -> None:
+    """Renders a figure into a path or file-like object.
 
     Args:
-        input_list: List to be iterated.
-        n: Element to be retrieved.
-
-    Returns:
-        (List[Any]): Only retrieved elements.
+        fig: Figure to be rendered.
+        file: Path or file-like object (e.g., `io.BytesIO`).
+        fmt: Output format (`pdf`, `svg` or `png`).
 
     """
 
-    if n < 0:
-        i = len(input_list[0]) + n
+    FigureCanvasAgg(fig).print_figure(file, format=fmt)
 
-    else:
-        i = n
-
-    return [a[i] for a in input_list]
 
-
-def _calculate_plot_properties(
-    sort_ranks: List[int], cd: float
-) -> Tuple[int, float, float, int, float, float]:
-    """Calculates a set of properties used to accurately plot the statistical test.
+def _render_critical_difference(args: Tuple[Any, ...]) -> bytes:
+    """Draws and renders a critical difference diagram into bytes (pool's task).
 
     Args:
-        sort_ranks: List holding the sorted ranks.
-        cd: Critical difference.
+        args: Averaged ranks, critical difference, labels, width, text spacing,
+            reverse and output format.
 
     Returns:
-        (Tuple[int, float, float, int, float, float]): Properties used in the plot's construction.
+        (bytes): Rendered diagram.
 
     """
 
-    n_ranks = len(sort_ranks)
-    n_lines = _get_amount_lines(sort_ranks, cd)
+    *draw_args, fmt = args
 
-    height_distance = 0.25
-    top_distance = height_distance + 0.4
+    buffer = io.BytesIO()
+    _save_figure(_draw_critical_difference(*draw_args), buffer, fmt)
 
-    blank_lines = 0.2 + 0.2 + (len(n_lines) - 1) * 0.1
-    not_sig_distance = max(2 * 0.2, blank_lines)
-    height = top_distance + ((n_ranks + 1) / 2) * 0.2 + not_sig_distance
+    return buffer.getvalue()
 
-    return n_ranks, height_distance, top_distance, n_lines, not_sig_distance, height
 
+def plot_critical_difference(
+    cd_dict: Dict[str, Any],
+    labels: Optional[List[str]] = None,
+    width: Optional[int] = 6,
+    text_spacing: Optional[int] = 2,
+    reverse: Optional[bool] = False,
+    save: Optional[bool] = True,
+    file: Optional[Union[str, IO, Dict[str, Union[str, IO]]]] = None,
+    fmt: Optional[str] = "pdf",
+    multipage: Optional[bool] = False,
+) -> Dict[str, Figure]:
+    """Plots the critical difference between the averaged ranks.
 
-def _prepare_plot(width: float, height: float) -> Tuple[Figure, Axis]:
-    """Prepares the plot prior to its use.
+    By default, each key is written to `cd_{key}.{fmt}`. A path with a `{key}` placeholder,
+    a dictionary of paths or file-like objects, or a single file-like object (for a
+    single key) may be supplied instead, while `multipage` writes every key into one PDF.
 
     Args:
-        width: Width of the plot.
-        height: Height of the plot.
+        cd_dict: Dictionary of average ranks and critical differences.
+        labels: List of stringed labels.
+        width: Plot's width.
+        text_spacing: Text spacing inside the plot.
+        reverse: Whether plot should use ascending or descending order.
+        save: Whether figures should be rendered or only returned.
+        file: Destination of the rendered figures.
+        fmt: Output format (`pdf`, `svg` or `png`).
+        multipage: Whether every figure should be written as a page of a single PDF.
 
     Returns:
-        (Tuple[Figure, Axis]): Figure and axis properties from the plot.
+        (Dict[str, Figure]): Figures keyed by the dictionary's keys.
 
     """
 
-    fig = Figure(figsize=(width, height))
+    if fmt not in ("pdf", "svg", "png"):
+        raise e.ValueError("`fmt` should be `pdf`, `svg` or `png`")
 
-    ax = fig.add_axes([0, 0, 1, 1])
-    ax.set_axis_off()
+    if multipage and fmt != "pdf":
+        raise e.ValueError("`multipage` is only available with `pdf`")
 
-    ax.plot([0, 1], [0, 1], c="w")
+    figures = {
+        key: _draw_critical_difference(v[0], v[1], labels, width, text_spacing, reverse)
+        for key, v in cd_dict.items()
+    }
 
-    ax.set_xlim(0, 1)
-    ax.set_ylim(1, 0)
+    if not save:
+        return figures
 
-    return fig, ax
+    if multipage:
+        with PdfPages(file or "cd.pdf") as pdf:
+            for fig in figures.values():
+                pdf.savefig(fig)
 
+        return figures
 
-def _position_rank(
-    index: int, low: int, high: int, text_spacing: int, scale: float, reverse: bool
-) -> int:
-    """Positions a rank according to its value.
+    if not (file is None or isinstance(file, (str, dict))) and len(figures) > 1:
+        raise e.ValueError("`file` should be a dictionary when plotting several keys")
 
-    Args:
-        index: Index to be positioned.
-        low: Minimum rank possible.
-        high: Maximum rank possible.
-        text_spacing: Text spacing inside the plot.
-        scale: Plot's scale.
-        reverse: Whether plot should use ascending or descending order.
+    if isinstance(file, str) and "{key}" not in file and len(figures) > 1:
+        raise e.ValueError("`file` should hold a `{key}` placeholder for several keys")
 
-    Returns:
-        (int): Rank should be positioned in the plot.
+    for key, fig in figures.items():
+        if file is None:
+            output = f"cd_{key}.{fmt}"
 
-    """
+        elif isinstance(file, str):
+            output = file.format(key=key)
 
-    if reverse:
-        x = high - index
+        elif isinstance(file, dict):
+            output = file[key]
 
-    else:
-        x = index - low
+        else:
+            output = file
 
-    return text_spacing + scale / (high - low) * x
+        _save_figure(fig, output, fmt)
 
+    return figures
 
-def plot_critical_difference(
+
+def render_critical_difference(
     cd_dict: Dict[str, Any],
     labels: Optional[List[str]] = None,
     width: Optional[int] = 6,
     text_spacing: Optional[int] = 2,
     reverse: Optional[bool] = False,
-) -> None:
-    """Plots the critical difference between the averaged ranks.
+    file: Optional[Union[str, Dict[str, Union[str, IO]]]] = None,
+    fmt: Optional[str] = "pdf",
+    n_jobs: Optional[int] = -1,
+    start_method: Optional[str] = None,
+) -> Dict[str, bytes]:
+    """Renders a batch of critical difference diagrams, spreading keys across a pool of
+    processes, where each worker draws and renders with its own Agg canvas.
 
     Args:
         cd_dict: Dictionary of average ranks and critical differences.
@@ -265,216 +242,60 @@ def plot_critical_difference(
         width: Plot's width.
         text_spacing: Text spacing inside the plot.
         reverse: Whether plot should use ascending or descending order.
+        file: Path with a `{key}` placeholder or dictionary of paths or file-like objects
+            where rendered diagrams are also written.
+        fmt: Output format (`pdf`, `svg` or `png`).
+        n_jobs: Amount of worker processes (-1 uses every core, while None or 1 renders serially).
+        start_method: Start method of the worker processes (defaults to the platform's).
 
-    """
-
-    scale = width - 2 * text_spacing
-
-    for key, v in cd_dict.items():
-        low, high = 1, v[0].shape[0]
-        ranks, cd = v[0], v[1]
-
-        sort_operator = sorted([(r, i) for i, r in enumerate(ranks)], reverse=reverse)
-        sort_ranks, sort_idx = _get_element(sort_operator, 0), _get_element(
-            sort_operator, 1
-        )
-
-        if labels and len(labels) == len(ranks):
-            pass
-
-        else:
-            labels = _create_labels(len(ranks))
-
-        sort_labels = [labels[i] for i in sort_idx]
-
-        # Calculates a set of properties used to perform an accurate plot
-        (
-            n_ranks,
-            height_distance,
-            top_distance,
-            n_lines,
-            not_sig_distance,
-            height,
-        ) = _calculate_plot_properties(sort_ranks, cd)
+    Returns:
+        (Dict[str, bytes]): Rendered diagrams keyed by the dictionary's keys (in its order).
 
-        fig, ax = _prepare_plot(width, height)
+    """
 
-        width_factor = 1 / width
-        height_factor = 1 / height
+    if fmt not in ("pdf", "svg", "png"):
+        raise e.ValueError("`fmt` should be `pdf`, `svg` or `png`")
 
-        x = (text_spacing, top_distance)
-        y = (width - text_spacing, top_distance)
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
 
-        _plot_line(ax, [x, y], width_factor, height_factor, linewidth=0.7)
+    if n_jobs is not None and n_jobs < 1:
+        raise e.ValueError("`n_jobs` should be -1 or greater than 0")
 
-        big_tick = 0.1
-        small_tick = 0.05
+    if isinstance(file, str) and "{key}" not in file and len(cd_dict) > 1:
+        raise e.ValueError("`file` should hold a `{key}` placeholder for several keys")
 
-        # Iterates over every possible value between low and high
-        # for plotting the ticks
-        for a in list(np.arange(low, high, 0.5)) + [high]:
-            tick = small_tick
+    keys = list(cd_dict.keys())
+    tasks = [
+        (cd_dict[key][0], cd_dict[key][1], labels, width, text_spacing, reverse, fmt)
+        for key in keys
+    ]
 
-            if isinstance(a, int):
-                tick = big_tick
+    if n_jobs is None or n_jobs == 1:
+        rendered = [_render_critical_difference(task) for task in tasks]
 
-            x = (
-                _position_rank(a, low, high, text_spacing, scale, reverse),
-                top_distance - tick / 2,
-            )
-            y = (
-                _position_rank(a, low, high, text_spacing, scale, reverse),
-                top_distance,
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs, mp_context=mp.get_context(start_method)
+        ) as pool:
+            chunk_size = max(1, len(tasks) // (4 * n_jobs))
+            rendered = list(
+                pool.map(_render_critical_difference, tasks, chunksize=chunk_size)
             )
 
-            _plot_line(ax, [x, y], width_factor, height_factor, linewidth=0.7)
-
-        # Iterates over every possible value between low and high
-        # for plotting the text
-        for a in range(low, high + 1):
-            _plot_text(
-                ax,
-                _position_rank(a, low, high, text_spacing, scale, reverse),
-                top_distance - tick / 2 - 0.05,
-                str(a),
-                width_factor,
-                height_factor,
-                ha="center",
-                va="bottom",
-            )
+    output = dict(zip(keys, rendered))
 
-        # Iterates over every possible left-sided rank
-        for i in range(int((n_ranks + 1) / 2)):
-            # Calculates the "line-arrow"
-            arrow = top_distance + not_sig_distance + i * 0.2
+    for key, value in output.items():
+        if file is None:
+            continue
 
-            x = (
-                _position_rank(sort_ranks[i], low, high, text_spacing, scale, reverse),
-                top_distance,
-            )
-            y = (
-                _position_rank(sort_ranks[i], low, high, text_spacing, scale, reverse),
-                arrow,
-            )
-            z = (text_spacing - 0.1, arrow)
-
-            _plot_line(ax, [x, y, z], width_factor, height_factor, linewidth=0.7)
-            _plot_text(
-                ax,
-                text_spacing - 0.2,
-                arrow,
-                sort_labels[i],
-                width_factor,
-                height_factor,
-                ha="right",
-                va="center",
-            )
+        target = file.format(key=key) if isinstance(file, str) else file[key]
 
-        # Iterates over every possible right-sided rank
-        for i in range(int((n_ranks + 1) / 2), n_ranks):
-            # Calculates the "line-arrow"
-            arrow = top_distance + not_sig_distance + (n_ranks - i - 1) * 0.2
-
-            x = (
-                _position_rank(sort_ranks[i], low, high, text_spacing, scale, reverse),
-                top_distance,
-            )
-            y = (
-                _position_rank(sort_ranks[i], low, high, text_spacing, scale, reverse),
-                arrow,
-            )
-            z = (text_spacing + scale + 0.1, arrow)
-
-            _plot_line(ax, [x, y, z], width_factor, height_factor, linewidth=0.7)
-            _plot_text(
-                ax,
-                text_spacing + scale + 0.2,
-                arrow,
-                sort_labels[i],
-                width_factor,
-                height_factor,
-                ha="left",
-                va="center",
-            )
-
-        if reverse:
-            # Calculates the starting and ending position from `high` values
-            start = _position_rank(high, low, high, text_spacing, scale, reverse)
-            end = _position_rank(high - cd, low, high, text_spacing, scale, reverse)
+        if isinstance(target, str):
+            with open(target, "wb") as f:
+                f.write(value)
 
         else:
-            # Calculates the starting and ending position from `low` values
-            start = _position_rank(low, low, high, text_spacing, scale, reverse)
-            end = _position_rank(low + cd, low, high, text_spacing, scale, reverse)
-
-        # Plots the starting and ending points of the CD line
-        _plot_line(
-            ax,
-            [(start, height_distance), (end, height_distance)],
-            width_factor,
-            height_factor,
-            linewidth=0.7,
-        )
-
-        # Plots the starting ticks of the CD line
-        _plot_line(
-            ax,
-            [
-                (start, height_distance + big_tick / 2),
-                (start, height_distance - big_tick / 2),
-            ],
-            width_factor,
-            height_factor,
-            linewidth=0.7,
-        )
-
-        # Plots the ending ticks of the CD line
-        _plot_line(
-            ax,
-            [
-                (end, height_distance + big_tick / 2),
-                (end, height_distance - big_tick / 2),
-            ],
-            width_factor,
-            height_factor,
-            linewidth=0.7,
-        )
-
-        # Plots the CD line itself
-        _plot_text(
-            ax,
-            (start + end) / 2,
-            height_distance - 0.05,
-            f"CD={cd}",
-            width_factor,
-            height_factor,
-            ha="center",
-            va="bottom",
-        )
-
-        # Plots non-significant lines
-        start = top_distance + 0.2
-
-        for left, right in n_lines:
-            x = (
-                _position_rank(
-                    sort_ranks[left], low, high, text_spacing, scale, reverse
-                )
-                - 0.05,
-                start,
-            )
-            y = (
-                _position_rank(
-                    sort_ranks[right], low, high, text_spacing, scale, reverse
-                )
-                + 0.05,
-                start,
-            )
-
-            _plot_line(ax, [x, y], width_factor, height_factor, linewidth=2.5)
-
-            # Adds height to distinguish between lines
-            start += 0.1
+            target.write(value)
 
-        canvas = FigureCanvasAgg(fig)
-        canvas.print_figure(f"cd_{key}.pdf")
+    return output
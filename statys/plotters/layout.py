@@ -0,0 +1,388 @@
+"""Backend-agnostic layouts of the plots, i.e., their geometry computed as arrays of
+segments and texts (in inches, with `y` growing downwards), which do not depend on matplotlib.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from statys.core.pairwise import PairwiseResult
+
+
+class CriticalDifferenceLayout(NamedTuple):
+    """Geometry of a critical difference diagram."""
+
+    width: float
+    height: float
+    segments: np.ndarray
+    linewidths: np.ndarray
+    text_positions: np.ndarray
+    texts: np.ndarray
+    text_ha: np.ndarray
+    text_va: np.ndarray
+
+
+def _create_labels(size: Optional[int] = 1) -> List[str]:
+    """Creates a list of labels strings.
+
+    Args:
+        size: Amount of strings to be created.
+
+    Returns:
+        (List[str]): Stringed labels, e.g., x0, x1, ..., xn.
+
+    """
+
+    labels = []
+
+    for i in range(size):
+        labels.append(f"$x_{{{i}}}$")
+
+    return labels
+
+
+def _get_amount_lines(ranks: List[int], cd: float) -> List[Tuple[int, int]]:
+    """Gets the lines that connect non-significantly different ranks, i.e., the maximal
+    intervals (i, j) of sorted ranks whose extremes differ by at most the critical difference.
+
+    As ranks are sorted, the furthest rank reached from `i` never moves backwards, thus
+    a two-pointer sweep finds every interval in linear time.
+
+    Args:
+        ranks: List of sorted (ascending or descending) ranks.
+        cd: Critical difference.
+
+    Returns:
+        (List[Tuple[int, int]]): Longest possible amount of lines.
+
+    """
+
+    n_ranks = len(ranks)
+
+    longest = []
+    j = previous = 0
+
+    for i in range(n_ranks):
+        j = max(j, i)
+
+        while j + 1 < n_ranks and abs(ranks[i] - ranks[j + 1]) <= cd:
+            j += 1
+
+        # An interval is only kept if it is not contained by the previous one
+        if j > i and (i == 0 or j > previous):
+            longest.append((i, j))
+
+        previous = j
+
+    return longest
+
+
+def _calculate_plot_properties(
+    sort_ranks: List[int], cd: float
+) -> Tuple[int, float, float, int, float, float]:
+    """Calculates a set of properties used to accurately plot the statistical test.
+
+    Args:
+        sort_ranks: List holding the sorted ranks.
+        cd: Critical difference.
+
+    Returns:
+        (Tuple[int, float, float, int, float, float]): Properties used in the plot's construction.
+
+    """
+
+    n_ranks = len(sort_ranks)
+    n_lines = _get_amount_lines(sort_ranks, cd)
+
+    height_distance = 0.25
+    top_distance = height_distance + 0.4
+
+    blank_lines = 0.2 + 0.2 + (len(n_lines) - 1) * 0.1
+    not_sig_distance = max(2 * 0.2, blank_lines)
+    height = top_distance + ((n_ranks + 1) / 2) * 0.2 + not_sig_distance
+
+    return n_ranks, height_distance, top_distance, n_lines, not_sig_distance, height
+
+
+def _position_rank(
+    index: int, low: int, high: int, text_spacing: int, scale: float, reverse: bool
+) -> int:
+    """Positions a rank according to its value.
+
+    Args:
+        index: Index to be positioned (or an array of indexes).
+        low: Minimum rank possible.
+        high: Maximum rank possible.
+        text_spacing: Text spacing inside the plot.
+        scale: Plot's scale.
+        reverse: Whether plot should use ascending or descending order.
+
+    Returns:
+        (int): Rank should be positioned in the plot.
+
+    """
+
+    if reverse:
+        x = high - index
+
+    else:
+        x = index - low
+
+    return text_spacing + scale / (high - low) * x
+
+
+def _create_grid_labels(size: Optional[int] = 1) -> List[str]:
+    """Creates a list of labels strings.
+
+    Args:
+        size: Amount of strings to be created.
+
+    Returns:
+        (List[str]): Stringed labels, e.g., arg0, arg1, ..., argn.
+
+    """
+
+    labels = []
+
+    for i in range(size):
+        labels.append(f"$arg_{{{i}}}$")
+
+    return labels
+
+
+def _get_matrix(
+    results: Union[Dict[str, Any], PairwiseResult, np.ndarray], field: int
+) -> np.ndarray:
+    """Gathers a k x k matrix from the outputs of a pairwise test.
+
+    Args:
+        results: Dictionary-based outputs, dense outputs or a k x k matrix.
+        field: Field to be gathered, i.e., 0 for h-indexes and 1 for p-values.
+
+    Returns:
+        (np.ndarray): Matrix of the field.
+
+    """
+
+    if isinstance(results, PairwiseResult):
+        return results.h if field == 0 else results.p
+
+    if isinstance(results, np.ndarray):
+        return results
+
+    # Calculates the number of arguments by solving: y = x^2 - x
+    n_args = round(np.roots([1, -1, -len(results)])[0])
+
+    matrix = np.full((n_args, n_args), np.nan)
+
+    for k, v in results.items():
+        # Gathers the positions from the arguments
+        args = k.replace("arg", "").split("-")
+
+        i, j = int(args[0]), int(args[1])
+        matrix[i][j] = v[field]
+
+    return matrix
+
+
+def critical_difference_layout(
+    ranks: np.ndarray,
+    cd: float,
+    labels: Optional[List[str]] = None,
+    width: Optional[int] = 6,
+    text_spacing: Optional[int] = 2,
+    reverse: Optional[bool] = False,
+) -> CriticalDifferenceLayout:
+    """Computes the geometry of a critical difference diagram.
+
+    Args:
+        ranks: Averaged ranks.
+        cd: Critical difference.
+        labels: List of stringed labels.
+        width: Plot's width.
+        text_spacing: Text spacing inside the plot.
+        reverse: Whether plot should use ascending or descending order.
+
+    Returns:
+        (CriticalDifferenceLayout): Segments and texts of the diagram.
+
+    """
+
+    ranks = np.asarray(ranks, dtype=np.float64)
+
+    scale = width - 2 * text_spacing
+    low, high = 1, ranks.shape[0]
+
+    # Sorts by rank (and index when tied), following the sorting of (rank, index) tuples
+    sort_idx = np.lexsort((np.arange(high), ranks))
+
+    if reverse:
+        sort_idx = sort_idx[::-1]
+
+    sort_ranks = ranks[sort_idx]
+
+    if not (labels and len(labels) == len(ranks)):
+        labels = _create_labels(len(ranks))
+
+    sort_labels = np.array([labels[i] for i in sort_idx], dtype=object)
+
+    (
+        n_ranks,
+        height_distance,
+        top_distance,
+        n_lines,
+        not_sig_distance,
+        height,
+    ) = _calculate_plot_properties(list(sort_ranks), cd)
+
+    def position(index):
+        return _position_rank(index, low, high, text_spacing, scale, reverse)
+
+    big_tick = 0.1
+    small_tick = 0.05
+
+    segments, linewidths = [], []
+
+    # Axis line
+    segments.append(
+        [[[text_spacing, top_distance], [width - text_spacing, top_distance]]]
+    )
+
+    # Ticks of every half rank, where the last one is a big tick
+    ticks = np.append(np.arange(low, high, 0.5), high)
+    tick_sizes = np.full(ticks.shape[0], small_tick)
+    tick_sizes[-1] = big_tick
+
+    x = position(ticks)
+    segments.append(
+        np.stack(
+            (
+                np.stack((x, top_distance - tick_sizes / 2), axis=1),
+                np.stack((x, np.full_like(x, top_distance)), axis=1),
+            ),
+            axis=1,
+        )
+    )
+
+    # "Line-arrows" from every rank to its label, where the first half is left-sided
+    half = int((n_ranks + 1) / 2)
+    i = np.arange(n_ranks)
+
+    arrow = (
+        top_distance + not_sig_distance + np.where(i < half, i, n_ranks - i - 1) * 0.2
+    )
+    end = np.where(i < half, text_spacing - 0.1, text_spacing + scale + 0.1)
+
+    x = position(sort_ranks)
+    segments.append(
+        np.stack(
+            (
+                np.stack((x, np.full_like(x, top_distance)), axis=1),
+                np.stack((x, arrow), axis=1),
+            ),
+            axis=1,
+        )
+    )
+    segments.append(
+        np.stack((np.stack((x, arrow), axis=1), np.stack((end, arrow), axis=1)), axis=1)
+    )
+
+    # Critical difference line and its ticks
+    if reverse:
+        start, stop = position(high), position(high - cd)
+
+    else:
+        start, stop = position(low), position(low + cd)
+
+    segments.append(
+        [
+            [[start, height_distance], [stop, height_distance]],
+            [
+                [start, height_distance + big_tick / 2],
+                [start, height_distance - big_tick / 2],
+            ],
+            [
+                [stop, height_distance + big_tick / 2],
+                [stop, height_distance - big_tick / 2],
+            ],
+        ]
+    )
+
+    for segment in segments:
+        linewidths.append(np.full(len(segment), 0.7))
+
+    # Non-significant lines, where height is added to distinguish between them
+    if n_lines:
+        left, right = np.array(n_lines).T
+        y = top_distance + 0.2 + np.arange(left.shape[0]) * 0.1
+
+        segments.append(
+            np.stack(
+                (
+                    np.stack((position(sort_ranks[left]) - 0.05, y), axis=1),
+                    np.stack((position(sort_ranks[right]) + 0.05, y), axis=1),
+                ),
+                axis=1,
+            )
+        )
+        linewidths.append(np.full(left.shape[0], 2.5))
+
+    segments = np.concatenate(
+        [
+            np.asarray(segment, dtype=np.float64).reshape(-1, 2, 2)
+            for segment in segments
+        ]
+    )
+
+    # Texts of the ticks, labels and critical difference
+    values = np.arange(low, high + 1)
+    side = i < half
+
+    text_positions = np.concatenate(
+        (
+            np.stack(
+                (
+                    position(values),
+                    np.full(values.shape[0], top_distance - big_tick / 2 - 0.05),
+                ),
+                axis=1,
+            ),
+            np.stack(
+                (np.where(side, text_spacing - 0.2, text_spacing + scale + 0.2), arrow),
+                axis=1,
+            ),
+            [[(start + stop) / 2, height_distance - 0.05]],
+        )
+    )
+    texts = np.concatenate(
+        (
+            values.astype(str).astype(object),
+            sort_labels,
+            np.array([f"CD={cd}"], dtype=object),
+        )
+    )
+    text_ha = np.concatenate(
+        (
+            np.full(values.shape[0], "center", dtype=object),
+            np.where(side, "right", "left").astype(object),
+            np.array(["center"], dtype=object),
+        )
+    )
+    text_va = np.concatenate(
+        (
+            np.full(values.shape[0], "bottom", dtype=object),
+            np.full(n_ranks, "center", dtype=object),
+            np.array(["bottom"], dtype=object),
+        )
+    )
+
+    return CriticalDifferenceLayout(
+        float(width),
+        float(height),
+        segments,
+        np.concatenate(linewidths),
+        text_positions,
+        texts,
+        text_ha,
+        text_va,
+    )
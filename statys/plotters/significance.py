@@ -1,30 +1,14 @@
 """Significance-based plotting utilities, such as h-index and p-value.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.axis import Axis
 
-
-def _create_labels(size: Optional[int] = 1) -> List[str]:
-    """Creates a list of labels strings.
-
-    Args:
-        size: Amount of strings to be created.
-
-    Returns:
-        (List[str]): Stringed labels, e.g., arg0, arg1, ..., argn.
-
-    """
-
-    labels = []
-
-    for i in range(size):
-        labels.append(f"$arg_{{{i}}}$")
-
-    return labels
+from statys.core.pairwise import PairwiseResult
+from statys.plotters.layout import _create_grid_labels, _get_matrix
 
 
 def _prepare_plot(n_args: int, labels: List[str], title: str) -> Axis:
@@ -46,7 +30,7 @@ def _prepare_plot(n_args: int, labels: List[str], title: str) -> Axis:
         pass
 
     else:
-        labels = _create_labels(n_args)
+        labels = _create_grid_labels(n_args)
 
     # Defines axis properties
     ax.set_xticks(np.arange(0, n_args, 1))
@@ -69,7 +53,7 @@ def _prepare_plot(n_args: int, labels: List[str], title: str) -> Axis:
 
 
 def plot_p_value(
-    p_dict: Dict[str, Any],
+    p_dict: Union[Dict[str, Any], PairwiseResult, np.ndarray],
     color_map: Optional[str] = "YlOrRd",
     labels: Optional[List[str]] = None,
     title: Optional[str] = None,
@@ -77,28 +61,19 @@ def plot_p_value(
     """Plots a p-value grid according to statistical results.
 
     Args:
-        p_dict: Significances and p-values.
+        p_dict: Significances and p-values (dictionary, dense outputs or p-valued matrix).
         color_map: Color map from matplotlib.
         labels: Stringed labels.
         title: Title to be displayed.
 
     """
 
-    # Calculates the number of arguments by solving: y = x^2 - x
-    n_args = round(np.roots([1, -1, -len(p_dict)])[0])
+    # Instantiates the p-valued matrix (diagonal is displayed as 1)
+    p = 1 - np.nan_to_num(_get_matrix(p_dict, 1), nan=1.0)
+    n_args = p.shape[0]
 
     ax = _prepare_plot(n_args, labels, title)
 
-    # Instantiates the p-valued matrix
-    p = np.zeros((n_args, n_args))
-
-    for k, v in p_dict.items():
-        # Gathers the positions from the arguments
-        args = k.replace("arg", "").split("-")
-
-        i, j = int(args[0]), int(args[1])
-        p[i][j] = 1 - v[1]
-
     # Iterates through the p-valued matrix
     for (i, j), z in np.ndenumerate(p):
         # Applies the corresponding value to the position
@@ -109,7 +84,7 @@ def plot_p_value(
 
 
 def plot_h_index(
-    h_dict: Dict[str, Any],
+    h_dict: Union[Dict[str, Any], PairwiseResult, np.ndarray],
     color_map: Optional[str] = "YlOrRd",
     labels: Optional[List[str]] = None,
     title: Optional[str] = None,
@@ -117,27 +92,18 @@ def plot_h_index(
     """Plots an h-index grid according to statistical results.
 
     Args:
-        h_dict: H-indexes and p-values.
+        h_dict: H-indexes and p-values (dictionary, dense outputs or h-indexed matrix).
         color_map: Color map from matplotlib.
         labels: Stringed labels.
         title: Title to be displayed.
 
     """
 
-    # Calculates the number of arguments by solving: y = x^2 - x
-    n_args = round(np.roots([1, -1, -len(h_dict)])[0])
-
-    ax = _prepare_plot(n_args, labels, title)
-
     # Instantiates the significance matrix
-    sigs = np.zeros((n_args, n_args), dtype="int")
+    sigs = np.nan_to_num(_get_matrix(h_dict, 0), nan=0).astype("int")
+    n_args = sigs.shape[0]
 
-    for k, v in h_dict.items():
-        # Gathers the positions from the arguments
-        args = k.replace("arg", "").split("-")
-
-        i, j = int(args[0]), int(args[1])
-        sigs[i][j] = v[0]
+    ax = _prepare_plot(n_args, labels, title)
 
     # Iterates through the significance matrix
     for (i, j), z in np.ndenumerate(sigs):
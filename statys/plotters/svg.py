@@ -0,0 +1,364 @@
+"""Lightweight SVG backend, which writes critical difference diagrams and significance
+grids straight to SVG text from their computed geometry, i.e., without matplotlib.
+"""
+
+import re
+from typing import IO, Any, Dict, List, Optional, Union
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+import statys.utils.exception as e
+from statys.core.pairwise import PairwiseResult
+from statys.plotters.layout import (
+    _create_grid_labels,
+    _get_matrix,
+    critical_difference_layout,
+)
+
+# Anchors of the `YlOrRd` color map (ColorBrewer), evenly spaced between 0 and 1
+YLORRD = np.array(
+    [
+        [255, 255, 204],
+        [255, 237, 160],
+        [254, 217, 118],
+        [254, 178, 76],
+        [253, 141, 60],
+        [252, 78, 42],
+        [227, 26, 28],
+        [189, 0, 38],
+        [128, 0, 38],
+    ],
+    dtype=np.float64,
+)
+
+# Amount of points (SVG user units) per inch, as in matplotlib's SVG backend
+DPI = 72
+
+# Font used by every text, following matplotlib's defaults
+FONT = 'font-family="DejaVu Sans, Bitstream Vera Sans, sans-serif" font-size="10"'
+
+# Simple mathtext labels, e.g., $x_{0}$, rendered as an italic base and a subscript
+_SUBSCRIPT = re.compile(r"^\$(\w+)_\{(\w+)\}\$$")
+
+_ANCHORS = {"center": "middle", "left": "start", "right": "end"}
+_BASELINES = {"center": "central", "bottom": "text-after-edge", "top": "hanging"}
+
+
+def _color_map(values: np.ndarray, n_colors: Optional[int] = 256) -> List[str]:
+    """Maps normalized values into `YlOrRd` colors, quantized as matplotlib's color maps.
+
+    Args:
+        values: Values between 0 and 1.
+        n_colors: Amount of quantized colors.
+
+    Returns:
+        (List[str]): Hexadecimal colors.
+
+    """
+
+    index = np.clip((np.asarray(values) * n_colors).astype(int), 0, n_colors - 1)
+
+    anchors = np.linspace(0, 1, YLORRD.shape[0])
+    x = index / (n_colors - 1)
+
+    rgb = np.stack([np.interp(x, anchors, YLORRD[:, c]) for c in range(3)], axis=-1)
+    rgb = np.round(rgb).astype(int)
+
+    return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in rgb.reshape(-1, 3)]
+
+
+def _text(
+    x: float,
+    y: float,
+    text: str,
+    ha: Optional[str] = "center",
+    va: Optional[str] = "center",
+) -> str:
+    """Creates an SVG text element.
+
+    Args:
+        x: `x` position.
+        y: `y` position.
+        text: String to be written (simple subscripted mathtext is supported).
+        ha: Horizontal alignment.
+        va: Vertical alignment.
+
+    Returns:
+        (str): SVG element.
+
+    """
+
+    match = _SUBSCRIPT.match(str(text))
+
+    if match:
+        content = (
+            f'<tspan font-style="italic">{escape(match.group(1))}</tspan>'
+            f'<tspan baseline-shift="sub" font-size="7">{escape(match.group(2))}</tspan>'
+        )
+
+    else:
+        content = escape(str(text).replace("$", ""))
+
+    return (
+        f'<text x="{x:.3f}" y="{y:.3f}" text-anchor="{_ANCHORS[ha]}" '
+        f'dominant-baseline="{_BASELINES[va]}">{content}</text>'
+    )
+
+
+def _document(width: float, height: float, elements: List[str]) -> str:
+    """Wraps elements into an SVG document.
+
+    Args:
+        width: Document's width (in points).
+        height: Document's height (in points).
+        elements: SVG elements.
+
+    Returns:
+        (str): SVG document.
+
+    """
+
+    return "\n".join(
+        [
+            '<?xml version="1.0" encoding="utf-8" standalone="no"?>',
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.3f}pt" '
+            f'height="{height:.3f}pt" viewBox="0 0 {width:.3f} {height:.3f}" {FONT}>',
+            f'<rect width="{width:.3f}" height="{height:.3f}" fill="#ffffff"/>',
+            *elements,
+            "</svg>",
+            "",
+        ]
+    )
+
+
+def _write(svg: str, file: Optional[Union[str, IO]] = None) -> None:
+    """Writes an SVG document into a path or text file-like object.
+
+    Args:
+        svg: SVG document.
+        file: Path or file-like object (nothing is written if None).
+
+    """
+
+    if file is None:
+        return
+
+    if isinstance(file, str):
+        with open(file, "w", encoding="utf-8") as f:
+            f.write(svg)
+
+    else:
+        file.write(svg)
+
+
+def critical_difference_svg(
+    ranks: np.ndarray,
+    cd: float,
+    labels: Optional[List[str]] = None,
+    width: Optional[int] = 6,
+    text_spacing: Optional[int] = 2,
+    reverse: Optional[bool] = False,
+) -> str:
+    """Renders the critical difference diagram of a set of averaged ranks.
+
+    Args:
+        ranks: Averaged ranks.
+        cd: Critical difference.
+        labels: List of stringed labels.
+        width: Plot's width.
+        text_spacing: Text spacing inside the plot.
+        reverse: Whether plot should use ascending or descending order.
+
+    Returns:
+        (str): SVG document.
+
+    """
+
+    layout = critical_difference_layout(ranks, cd, labels, width, text_spacing, reverse)
+
+    segments = layout.segments * DPI
+
+    elements = ['<g stroke="#000000" stroke-linecap="square" fill="none">']
+
+    for ((x1, y1), (x2, y2)), linewidth in zip(segments, layout.linewidths):
+        elements.append(
+            f'<line x1="{x1:.3f}" y1="{y1:.3f}" x2="{x2:.3f}" y2="{y2:.3f}" '
+            f'stroke-width="{linewidth}"/>'
+        )
+
+    elements.append("</g>")
+
+    for (x, y), text, ha, va in zip(
+        layout.text_positions * DPI, layout.texts, layout.text_ha, layout.text_va
+    ):
+        elements.append(_text(x, y, text, ha, va))
+
+    return _document(layout.width * DPI, layout.height * DPI, elements)
+
+
+def plot_critical_difference(
+    cd_dict: Dict[str, Any],
+    labels: Optional[List[str]] = None,
+    width: Optional[int] = 6,
+    text_spacing: Optional[int] = 2,
+    reverse: Optional[bool] = False,
+    file: Optional[Union[str, Dict[str, Union[str, IO]]]] = None,
+) -> Dict[str, str]:
+    """Renders the critical difference between the averaged ranks as SVG documents.
+
+    Args:
+        cd_dict: Dictionary of average ranks and critical differences.
+        labels: List of stringed labels.
+        width: Plot's width.
+        text_spacing: Text spacing inside the plot.
+        reverse: Whether plot should use ascending or descending order.
+        file: Path with a `{key}` placeholder or dictionary of paths or file-like objects
+            where documents are also written.
+
+    Returns:
+        (Dict[str, str]): SVG documents keyed by the dictionary's keys.
+
+    """
+
+    if isinstance(file, str) and "{key}" not in file and len(cd_dict) > 1:
+        raise e.ValueError("`file` should hold a `{key}` placeholder for several keys")
+
+    output = {}
+
+    for key, v in cd_dict.items():
+        output[key] = critical_difference_svg(
+            v[0], v[1], labels, width, text_spacing, reverse
+        )
+
+        if file is not None:
+            _write(
+                output[key],
+                file.format(key=key) if isinstance(file, str) else file[key],
+            )
+
+    return output
+
+
+def _grid_svg(
+    values: np.ndarray,
+    texts: np.ndarray,
+    labels: Optional[List[str]] = None,
+    title: Optional[str] = None,
+    color_map: Optional[str] = "YlOrRd",
+) -> str:
+    """Renders a k x k grid of colored cells, following matplotlib's `imshow`.
+
+    Args:
+        values: Matrix of values to be colored (normalized by their minimum and maximum).
+        texts: Matrix of strings written in each cell.
+        labels: Stringed labels.
+        title: Title to be displayed.
+        color_map: Color map (only `YlOrRd` is embedded).
+
+    Returns:
+        (str): SVG document.
+
+    """
+
+    if color_map != "YlOrRd":
+        raise e.ValueError("`color_map` should be `YlOrRd`")
+
+    n_args = values.shape[0]
+
+    if not (labels and len(labels) == n_args):
+        labels = _create_grid_labels(n_args)
+
+    # Values are linearly normalized, where constant values are mapped to the lowest color
+    low, high = (np.min(values), np.max(values)) if values.size else (0, 0)
+    scaled = (values - low) / (high - low) if high > low else np.zeros_like(values)
+    colors = _color_map(scaled.ravel())
+
+    cell, gap = 40, 3
+    left, top = 70, 60 if title else 40
+
+    elements = []
+
+    if title:
+        elements.append(_text(left + n_args * cell / 2, 18, title, "center", "center"))
+
+    for m, (i, j) in enumerate(np.ndindex(n_args, n_args)):
+        x, y = left + j * cell, top + i * cell
+
+        elements.append(
+            f'<rect x="{x + gap / 2:.3f}" y="{y + gap / 2:.3f}" width="{cell - gap}" '
+            f'height="{cell - gap}" fill="{colors[m]}"/>'
+        )
+        elements.append(_text(x + cell / 2, y + cell / 2, texts[i, j]))
+
+    for i, label in enumerate(labels):
+        elements.append(
+            _text(left + i * cell + cell / 2, top - 8, label, "center", "bottom")
+        )
+        elements.append(
+            _text(left - 8, top + i * cell + cell / 2, label, "right", "center")
+        )
+
+    return _document(left + n_args * cell + 20, top + n_args * cell + 20, elements)
+
+
+def plot_p_value(
+    p_dict: Union[Dict[str, Any], PairwiseResult, np.ndarray],
+    color_map: Optional[str] = "YlOrRd",
+    labels: Optional[List[str]] = None,
+    title: Optional[str] = None,
+    file: Optional[Union[str, IO]] = None,
+) -> str:
+    """Renders a p-value grid according to statistical results as an SVG document.
+
+    Args:
+        p_dict: Significances and p-values (dictionary, dense outputs or p-valued matrix).
+        color_map: Color map (only `YlOrRd` is embedded).
+        labels: Stringed labels.
+        title: Title to be displayed.
+        file: Path or file-like object where the document is also written.
+
+    Returns:
+        (str): SVG document.
+
+    """
+
+    # Instantiates the p-valued matrix (diagonal is displayed as 1)
+    p = 1 - np.nan_to_num(_get_matrix(p_dict, 1), nan=1.0)
+
+    texts = np.vectorize(lambda z: "{:0.3f}".format(1 - z), otypes=[object])(p)
+
+    svg = _grid_svg(p, texts, labels, title, color_map)
+    _write(svg, file)
+
+    return svg
+
+
+def plot_h_index(
+    h_dict: Union[Dict[str, Any], PairwiseResult, np.ndarray],
+    color_map: Optional[str] = "YlOrRd",
+    labels: Optional[List[str]] = None,
+    title: Optional[str] = None,
+    file: Optional[Union[str, IO]] = None,
+) -> str:
+    """Renders an h-index grid according to statistical results as an SVG document.
+
+    Args:
+        h_dict: H-indexes and p-values (dictionary, dense outputs or h-indexed matrix).
+        color_map: Color map (only `YlOrRd` is embedded).
+        labels: Stringed labels.
+        title: Title to be displayed.
+        file: Path or file-like object where the document is also written.
+
+    Returns:
+        (str): SVG document.
+
+    """
+
+    # Instantiates the significance matrix
+    sigs = np.nan_to_num(_get_matrix(h_dict, 0), nan=0).astype("int")
+
+    svg = _grid_svg(sigs.astype(float), sigs.astype(str), labels, title, color_map)
+    _write(svg, file)
+
+    return svg
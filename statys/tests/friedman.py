@@ -1,15 +1,174 @@
 """Friedman-related tests and their post-hocs.
 """
 
+from typing import NamedTuple
+
 import numpy as np
+import scipy.stats as s
 
 import statys.tests.measure as m
-import statys.utils.constants as c
+import statys.utils.critical_values as cv
+import statys.utils.exception as e
+from statys.core.pairwise import ControlResult, PairwiseResult, calculate_hypotheses
 from statys.utils import logging
 
 logger = logging.get_logger(__name__)
 
 
+class BatchFriedman(NamedTuple):
+    """Outputs of the Friedman and Iman-Davenport tests over a batch of experiments,
+    where the i-th position holds the outputs of the i-th experiment.
+
+    """
+
+    average_ranks: np.ndarray
+    statistic: np.ndarray
+    dof: np.ndarray
+    p: np.ndarray
+    iman: np.ndarray
+    f_dist: np.ndarray
+    iman_p: np.ndarray
+
+
+class IncrementalFriedman:
+    """An accumulator of the Friedman test, which ranks only newly added blocks and keeps
+    the running rank sums, so the statistics are available at any moment in O(k).
+
+    """
+
+    def __init__(self, k=None):
+        """Initialization method.
+
+        Args:
+            k (int): Amount of treatments (inferred from the first blocks if None).
+
+        """
+
+        self.k = k
+        self.n = 0
+
+        self.rank_sums = None if k is None else np.zeros(k)
+
+    @property
+    def average_ranks(self):
+        """Average ranks of the treatments."""
+
+        if self.n == 0:
+            return None
+
+        return self.rank_sums / self.n
+
+    def update(self, blocks):
+        """Ranks and accumulates new blocks.
+
+        Args:
+            blocks (np.ndarray): Array of (blocks x treatments) values.
+
+        Returns:
+            The updated accumulator.
+
+        """
+
+        blocks = np.atleast_2d(np.asarray(blocks, dtype=np.float64))
+
+        if blocks.ndim != 2:
+            raise e.SizeError("`blocks` should be a (blocks x treatments) array")
+
+        # Treatments are only inferred once the first blocks are valid
+        k = blocks.shape[1] if self.k is None else self.k
+
+        if k < 2 or blocks.shape[1] != k:
+            raise e.SizeError(f"`blocks` should have {max(k, 2)} treatments")
+
+        if self.k is None:
+            self.k = k
+            self.rank_sums = np.zeros(k)
+
+        self.rank_sums += np.sum(m.rankdata(blocks, axis=1), axis=0)
+        self.n += blocks.shape[0]
+
+        return self
+
+    def statistics(self):
+        """Calculates the Friedman and Iman-Davenport statistics of the accumulated blocks.
+
+        Returns:
+            Friedman's statistic and its degrees of freedom, as well as Iman-Davenport's
+                statistic and its F-distribution, following `friedman`.
+
+        """
+
+        if self.n == 0:
+            raise e.ValueError("`blocks` should be added before calculating statistics")
+
+        f, iman, f_dist = _statistics(self.average_ranks, self.n)
+
+        return (f, self.k - 1), (iman, f_dist)
+
+    def critical_difference(self, alpha=0.05, post_hoc="nemenyi"):
+        """Calculates the critical difference of the accumulated blocks.
+
+        Args:
+            alpha (float): Significance value.
+            post_hoc (str): Type of post-hoc analysis.
+
+        Returns:
+            Critical difference.
+
+        """
+
+        if self.n == 0:
+            raise e.ValueError("`blocks` should be added before calculating statistics")
+
+        q = cv.critical_value(self.k, alpha, post_hoc)
+
+        return q * (self.k * (self.k + 1) / (6 * self.n)) ** 0.5
+
+
+def _statistics(average_ranks, n):
+    """Calculates the Friedman and Iman-Davenport statistics from average ranks.
+
+    Args:
+        average_ranks (np.ndarray): Average ranks of the treatments (along the last axis).
+        n (int): Amount of blocks.
+
+    Returns:
+        Friedman's statistic, Iman-Davenport's statistic and F-distribution's parameters.
+
+    """
+
+    k = average_ranks.shape[-1]
+
+    f = (
+        12
+        * n
+        * (np.sum(average_ranks**2.0, axis=-1) - (k * (k + 1) * (k + 1) / 4))
+        / (k * (k + 1))
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        iman = (n - 1) * f / (n * (k - 1) - f)
+
+    return f, iman, (k - 1, (k - 1) * (n - 1))
+
+
+def _rank(dist, **kwargs):
+    """Ranks a distribution, where `doubled=True` keeps int32 doubled ranks (half of the
+    memory), which are halved by the consumers only once they are reduced.
+
+    Args:
+        dist (Distribution): Distribution to be ranked.
+
+    Returns:
+        Dictionary holding the ranks and the scale of the ranks (2 if doubled, else 1).
+
+    """
+
+    scale = 2 if kwargs.get("doubled") else 1
+
+    return m.rank(dist, **kwargs), scale
+
+
 def friedman(dist, **kwargs):
     """Performs the Friedman test.
 
@@ -26,7 +185,7 @@ def friedman(dist, **kwargs):
     output = {}
 
     # Computes the average ranks (axis keyword should be used accordingly)
-    average_ranks = m.rank(dist, **kwargs)
+    average_ranks, scale = _rank(dist, **kwargs)
 
     for key, val in average_ranks.items():
         n = 1
@@ -36,23 +195,181 @@ def friedman(dist, **kwargs):
 
             val = np.mean(val, axis=0)
 
+        val = val / scale
+
         k = len(val)
 
-        # Calculates the Friedman's statistic
-        f = (
-            12
-            * n
-            * (sum([v**2.0 for v in val]) - (k * (k + 1) * (k + 1) / 4))
-            / (k * (k + 1))
+        # Calculates the Friedman's and Iman's statistics, as well as the F-distribution
+        f, iman, f_dist = _statistics(val, n)
+
+        output[key] = (f, k - 1), (iman, f_dist)
+
+    logger.info("Test performed.")
+    logger.debug(output)
+
+    return output
+
+
+def _posthoc(ranks, post_hoc="nemenyi", rows=None, scale=1):
+    """Calculates the post-hoc statistics and p-values between treatments at once.
+
+    Args:
+        ranks (np.ndarray): Array of (blocks x treatments) ranks.
+        post_hoc (str): Type of post-hoc analysis (`nemenyi`, `conover` or `bonferroni-dunn`).
+        rows (np.ndarray): Indexes of the treatments compared against every other one.
+        scale (int): Scale of the ranks, i.e., 2 if they are doubled.
+
+    Returns:
+        Statistics and p-values of the (rows x treatments) comparisons.
+
+    """
+
+    n, k = ranks.shape
+
+    if rows is None:
+        rows = np.arange(k)
+
+    average_ranks = np.mean(ranks, axis=0) / scale
+
+    if post_hoc == "conover":
+        # Conover's test compares rank sums with a t-distribution
+        rank_sums = n * average_ranks
+        dof = (n - 1) * (k - 1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            squares = np.sum(np.square(ranks, dtype=np.float64)) / scale**2
+            se = np.sqrt(2 * (n * squares - np.sum(rank_sums**2)) / dof)
+            statistic = (rank_sums[rows, None] - rank_sums[None, :]) / se
+
+        p = 2 * s.t.sf(np.abs(statistic), dof)
+
+    elif post_hoc in ("nemenyi", "bonferroni-dunn"):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            statistic = (average_ranks[rows, None] - average_ranks[None, :]) / np.sqrt(
+                k * (k + 1) / (6 * n)
+            )
+
+        if post_hoc == "nemenyi":
+            # As average ranks repeat, the distribution is only evaluated over unique values
+            unique, inverse = np.unique(np.abs(statistic), return_inverse=True)
+            p = s.studentized_range.sf(unique * np.sqrt(2), k, np.inf)[
+                inverse.reshape(statistic.shape)
+            ]
+
+        else:
+            p = np.minimum(2 * s.norm.sf(np.abs(statistic)) * (k - 1), 1)
+
+    else:
+        raise e.ValueError(
+            "`post_hoc` should be `nemenyi`, `conover` or `bonferroni-dunn`"
         )
 
-        # Calculates the F-distribution
-        f_dist = (k - 1, (k - 1) * (n - 1))
+    return statistic, p
 
-        # Calculates the Iman's statistic
-        iman = (n - 1) * f / (n * (k - 1) - f)
 
-        output[key] = (f, k - 1), (iman, f_dist)
+def friedman_posthoc(dist, alpha=0.05, post_hoc="nemenyi", control=None, **kwargs):
+    """Performs a Friedman's post-hoc analysis between every pair of treatments (or between
+    a control treatment and the remaining ones), where treatments are the ranked columns.
+
+    Args:
+        dist (Distribution): Distribution to be analyzed.
+        alpha (float): Significance value.
+        post_hoc (str): Type of post-hoc analysis (`nemenyi`, `conover` or `bonferroni-dunn`).
+        control (int): Index of a control treatment (required by `bonferroni-dunn`).
+
+    Returns:
+        Dictionary holding the test's outputs (PairwiseResult or ControlResult).
+
+    """
+
+    logger.info("Performing Friedman-%s post-hoc ...", post_hoc)
+
+    if post_hoc == "bonferroni-dunn" and control is None:
+        raise e.ValueError("`control` should be supplied to `bonferroni-dunn`")
+
+    output = {}
+
+    # Computes the ranks (axis keyword should be used accordingly)
+    ranks, scale = _rank(dist, **kwargs)
+
+    for key, val in ranks.items():
+        val = np.atleast_2d(val)
+        k = val.shape[1]
+
+        labels = np.arange(k).astype(str)
+
+        if control is None:
+            statistic, p = _posthoc(val, post_hoc, scale=scale)
+
+            np.fill_diagonal(statistic, np.nan)
+            np.fill_diagonal(p, np.nan)
+
+            h = calculate_hypotheses(p, alpha)
+            np.fill_diagonal(h, 0)
+
+            output[key] = PairwiseResult(labels, statistic, p, h)
+
+        else:
+            if not 0 <= control < k:
+                raise e.ValueError(f"`control` should be between 0 and {k - 1}")
+
+            others = np.array([j for j in range(k) if j != control], dtype=int)
+
+            statistic, p = _posthoc(val, post_hoc, np.array([control]), scale)
+            statistic, p = statistic[0, others], p[0, others]
+
+            output[key] = ControlResult(
+                str(labels[control]),
+                labels[others],
+                statistic,
+                p,
+                calculate_hypotheses(p, alpha),
+            )
+
+    logger.info("Post-hoc performed.")
+    logger.debug(output)
+
+    return output
+
+
+def friedman_batch(data):
+    """Performs the Friedman and Iman-Davenport tests over a batch of experiments at once,
+    ranking every block along the treatments' axis in a single call.
+
+    Args:
+        data (np.ndarray): Array of (experiments x blocks x treatments) values, where
+            a 2-dimensional array is considered as a single experiment.
+
+    Returns:
+        BatchFriedman holding the test's outputs.
+
+    """
+
+    logger.info("Performing batched Friedman test ...")
+
+    data = np.asarray(data, dtype=np.float64)
+
+    if data.ndim == 2:
+        data = data[None]
+
+    if data.ndim != 3:
+        raise e.SizeError("`data` should be a 2 or 3-dimensional array")
+
+    n, k = data.shape[1], data.shape[2]
+
+    average_ranks = np.mean(m.rankdata(data, axis=-1), axis=1)
+
+    f, iman, (dof_num, dof_den) = _statistics(average_ranks, n)
+
+    output = BatchFriedman(
+        average_ranks,
+        f,
+        np.full_like(f, k - 1),
+        s.chi2.sf(f, k - 1),
+        iman,
+        np.tile(np.array([dof_num, dof_den], dtype=float), (f.shape[0], 1)),
+        s.f.sf(iman, dof_num, dof_den),
+    )
 
     logger.info("Test performed.")
     logger.debug(output)
@@ -78,18 +395,7 @@ def friedman_with_posthoc(dist, alpha=0.05, post_hoc="nemenyi", **kwargs):
     output = {}
 
     # Computes the average ranks (axis keyword should be used accordingly)
-    average_ranks = m.rank(dist, **kwargs)
-
-    if alpha == 0.01:
-        critical_index = 0
-
-    elif alpha == 0.05:
-        critical_index = 1
-
-    elif alpha == 0.1:
-        critical_index = 2
-
-    q = np.asarray(c.CRITICAL_VALUES[post_hoc])[:, critical_index]
+    average_ranks, scale = _rank(dist, **kwargs)
 
     for key, val in average_ranks.items():
         n = 1
@@ -99,10 +405,13 @@ def friedman_with_posthoc(dist, alpha=0.05, post_hoc="nemenyi", **kwargs):
 
             val = np.mean(val, axis=0)
 
+        val = val / scale
+
         k = len(val)
 
         # Calculates the critical difference
-        cd = q[k - 1] * (k * (k + 1) / (6 * n)) ** 0.5
+        q = cv.critical_value(k, alpha, post_hoc)
+        cd = q * (k * (k + 1) / (6 * n)) ** 0.5
 
         output[key] = (val, cd)
 
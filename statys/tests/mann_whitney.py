@@ -3,27 +3,59 @@
 
 import scipy.stats as s
 
+import statys.utils.kernels as k
 import statys.utils.wrappers as w
 from statys.utils import logging
 
 logger = logging.get_logger(__name__)
 
 
-def u_test(dist, alpha=0.05):
+def mirror_u(u, x, y):
+    """Mirrors the U statistic of (x, y) into the one of (y, x).
+
+    Args:
+        u (float): U statistic of (x, y).
+        x (np.ndarray): First sample.
+        y (np.ndarray): Second sample.
+
+    Returns:
+        U statistic of (y, x).
+
+    """
+
+    return len(x) * len(y) - u
+
+
+def u_test(dist, alpha=0.05, as_matrix=False, n_jobs=None, control=None):
     """Performs the Mann-Whitney U test.
 
     Args:
         dist (Distribution): Distribution to be analyzed.
         alpha (float): Significance value.
+        as_matrix (bool): Whether outputs should be dense matrices instead of a dictionary.
+        n_jobs (int): Amount of worker processes that run the scipy test pair-by-pair
+            instead of the vectorized kernel (-1 uses every core, while None or 1 keeps
+            the vectorized kernel).
+        control (str): Label of a control argument, which is only compared against the others.
 
     Returns:
-        Dictionary holding the test's outputs.
+        Dictionary (or PairwiseResult / ControlResult) holding the test's outputs.
 
     """
 
     logger.info("Performing Mann-Whitney U test ...")
 
-    output = w.statistical_pipeline(s.mannwhitneyu, dist, alpha)
+    output = w.statistical_pipeline(
+        s.mannwhitneyu,
+        dist,
+        alpha,
+        symmetric=True,
+        kernel=k.MannWhitneyKernel if n_jobs in (None, 1) else None,
+        mirror=mirror_u,
+        as_matrix=as_matrix,
+        n_jobs=n_jobs,
+        control=control,
+    )
 
     logger.info("Test performed.")
     logger.debug(output)
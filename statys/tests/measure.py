@@ -1,20 +1,133 @@
 """Statistical-related measures.
 """
 
+from typing import NamedTuple
+
 import numpy as np
 import scipy.stats as s
 
+import statys.utils.constants as c
 import statys.utils.wrappers as w
+from statys.core.distribution import StreamingDistribution
 from statys.utils import logging
+from statys.utils.moments import Moments
+from statys.utils.ranks import rankdata
 
 logger = logging.get_logger(__name__)
 
 
-def kurtosis(dist, **kwargs):
+class Description(NamedTuple):
+    """Summary statistics of a distribution's argument."""
+
+    n: int
+    min: float
+    max: float
+    mean: float
+    median: float
+    var: float
+    std: float
+    skewness: float
+    kurtosis: float
+
+
+def _median(values):
+    """Finds the median of an array with a single partial sort.
+
+    Args:
+        values (np.ndarray): Array of values.
+
+    Returns:
+        Median value.
+
+    """
+
+    values = np.asarray(values).ravel()
+    n = values.shape[0]
+
+    if n == 0:
+        return np.nan
+
+    half = n // 2
+
+    if n % 2:
+        return np.partition(values, half)[half]
+
+    partitioned = np.partition(values, (half - 1, half))
+
+    return (partitioned[half - 1] + partitioned[half]) / 2
+
+
+def describe(dist, ddof=0, bias=True, fisher=True, n_jobs=None, executor=None):
+    """Summarizes a distribution in a single pass over each argument, i.e., gathers its
+    size, minimum, maximum, mean, median, variance, standard deviation, skewness and kurtosis.
+
+    Note that memory-mapped arguments are read in chunks, thus their median (which
+    would load the whole argument into memory) is not calculated and is NaN.
+
+    Args:
+        dist (Distribution): Distribution to be analyzed.
+        ddof (int): Delta degrees of freedom of variance and standard deviation.
+        bias (bool): Whether skewness and kurtosis should not be corrected for statistical bias.
+        fisher (bool): Whether Fisher's (excess) or Pearson's kurtosis should be used.
+        n_jobs (int): Amount of threads used to describe the arguments (-1 uses every core).
+        executor (Executor): Executor used to describe the arguments.
+
+    Returns:
+        Dictionary holding the measure's outputs.
+
+    """
+
+    logger.info("Describing distribution ...")
+
+    if isinstance(dist, StreamingDistribution):
+        moments = dict(dist.moments)
+        values = dict(dist.attrs) if dist.keep_values else {}
+
+    else:
+        values = dict(dist.attrs)
+        moments = {attr: None for attr in values}
+
+    def _describe(attr):
+        m = moments[attr]
+        median = attr in values and not isinstance(values[attr], np.memmap)
+
+        if m is None:
+            value = values[attr]
+
+            if isinstance(value, np.memmap):
+                m = Moments.from_chunks(value, c.CHUNK_SIZE)
+
+            else:
+                m = Moments.from_array(value)
+
+        return Description(
+            m.n,
+            m.min(),
+            m.max(),
+            m.mean(),
+            _median(values[attr]) if median else np.nan,
+            m.var(ddof),
+            m.std(ddof),
+            m.skewness(bias),
+            m.kurtosis(fisher, bias),
+        )
+
+    attrs = list(moments.keys())
+    output = dict(zip(attrs, w.parallel_map(_describe, attrs, n_jobs, executor)))
+
+    logger.info("Distribution described.")
+    logger.debug(output)
+
+    return output
+
+
+def kurtosis(dist, n_jobs=None, executor=None, **kwargs):
     """Measures the kurtosis of a distribution.
 
     Args:
         dist (Distribution): Distribution to be analyzed.
+        n_jobs (int): Amount of threads used to measure the arguments (-1 uses every core).
+        executor (Executor): Executor used to measure the arguments.
 
     Returns:
         Dictionary holding the measure's outputs.
@@ -23,7 +136,14 @@ def kurtosis(dist, **kwargs):
 
     logger.info("Calculating kurtosis ...")
 
-    output = w.measure_pipeline(s.kurtosis, dist, **kwargs)
+    output = w.measure_pipeline(
+        s.kurtosis,
+        dist,
+        streamed=Moments.kurtosis,
+        n_jobs=n_jobs,
+        executor=executor,
+        **kwargs,
+    )
 
     logger.info("Kurtosis calculated.")
     logger.debug(output)
@@ -31,11 +151,13 @@ def kurtosis(dist, **kwargs):
     return output
 
 
-def max(dist, **kwargs):
+def max(dist, n_jobs=None, executor=None, **kwargs):
     """Measures the maximum value of a distribution.
 
     Args:
         dist (Distribution): Distribution to be analyzed.
+        n_jobs (int): Amount of threads used to measure the arguments (-1 uses every core).
+        executor (Executor): Executor used to measure the arguments.
 
     Returns:
         Dictionary holding the measure's outputs.
@@ -44,7 +166,9 @@ def max(dist, **kwargs):
 
     logger.info("Finding maximum value ...")
 
-    output = w.measure_pipeline(np.max, dist, **kwargs)
+    output = w.measure_pipeline(
+        np.max, dist, streamed=Moments.max, n_jobs=n_jobs, executor=executor, **kwargs
+    )
 
     logger.info("Maximum value found.")
     logger.debug(output)
@@ -52,11 +176,13 @@ def max(dist, **kwargs):
     return output
 
 
-def mean(dist, **kwargs):
+def mean(dist, n_jobs=None, executor=None, **kwargs):
     """Measures the mean of a distribution.
 
     Args:
         dist (Distribution): Distribution to be analyzed.
+        n_jobs (int): Amount of threads used to measure the arguments (-1 uses every core).
+        executor (Executor): Executor used to measure the arguments.
 
     Returns:
         Dictionary holding the measure's outputs.
@@ -65,7 +191,9 @@ def mean(dist, **kwargs):
 
     logger.info("Calculating mean ...")
 
-    output = w.measure_pipeline(np.mean, dist, **kwargs)
+    output = w.measure_pipeline(
+        np.mean, dist, streamed=Moments.mean, n_jobs=n_jobs, executor=executor, **kwargs
+    )
 
     logger.info("Mean calculated.")
     logger.debug(output)
@@ -73,11 +201,13 @@ def mean(dist, **kwargs):
     return output
 
 
-def median(dist, **kwargs):
+def median(dist, n_jobs=None, executor=None, **kwargs):
     """Measures the median of a distribution.
 
     Args:
         dist (Distribution): Distribution to be analyzed.
+        n_jobs (int): Amount of threads used to measure the arguments (-1 uses every core).
+        executor (Executor): Executor used to measure the arguments.
 
     Returns:
         Dictionary holding the measure's outputs.
@@ -86,7 +216,9 @@ def median(dist, **kwargs):
 
     logger.info("Calculating median ...")
 
-    output = w.measure_pipeline(np.median, dist, **kwargs)
+    output = w.measure_pipeline(
+        np.median, dist, n_jobs=n_jobs, executor=executor, **kwargs
+    )
 
     logger.info("Median calculated.")
     logger.debug(output)
@@ -94,11 +226,13 @@ def median(dist, **kwargs):
     return output
 
 
-def min(dist, **kwargs):
+def min(dist, n_jobs=None, executor=None, **kwargs):
     """Measures the minimum value of a distribution.
 
     Args:
         dist (Distribution): Distribution to be analyzed.
+        n_jobs (int): Amount of threads used to measure the arguments (-1 uses every core).
+        executor (Executor): Executor used to measure the arguments.
 
     Returns:
         Dictionary holding the measure's outputs.
@@ -107,7 +241,9 @@ def min(dist, **kwargs):
 
     logger.info("Finding minimum value ...")
 
-    output = w.measure_pipeline(np.min, dist, **kwargs)
+    output = w.measure_pipeline(
+        np.min, dist, streamed=Moments.min, n_jobs=n_jobs, executor=executor, **kwargs
+    )
 
     logger.info("Minimum value found.")
     logger.debug(output)
@@ -115,11 +251,16 @@ def min(dist, **kwargs):
     return output
 
 
-def rank(dist, **kwargs):
+def rank(dist, n_jobs=None, executor=None, **kwargs):
     """Ranks the values of a distribution.
 
+    Note that `rankdata` is used unless another tie method or NaN policy is requested,
+    which are delegated to `scipy.stats.rankdata`.
+
     Args:
         dist (Distribution): Distribution to be analyzed.
+        n_jobs (int): Amount of threads used to measure the arguments (-1 uses every core).
+        executor (Executor): Executor used to measure the arguments.
 
     Returns:
         Dictionary holding the measure's outputs.
@@ -128,7 +269,17 @@ def rank(dist, **kwargs):
 
     logger.info("Ranking distribution ...")
 
-    output = w.measure_pipeline(s.rankdata, dist, **kwargs)
+    if kwargs.get("method", "average") == "average" and "nan_policy" not in kwargs:
+        kwargs.pop("method", None)
+
+        measure = rankdata
+
+    else:
+        measure = s.rankdata
+
+    output = w.measure_pipeline(
+        measure, dist, n_jobs=n_jobs, executor=executor, **kwargs
+    )
 
     logger.info("Distribution ranked.")
     logger.debug(output)
@@ -136,11 +287,13 @@ def rank(dist, **kwargs):
     return output
 
 
-def skewness(dist, **kwargs):
+def skewness(dist, n_jobs=None, executor=None, **kwargs):
     """Measures the skewness of a distribution.
 
     Args:
         dist (Distribution): Distribution to be analyzed.
+        n_jobs (int): Amount of threads used to measure the arguments (-1 uses every core).
+        executor (Executor): Executor used to measure the arguments.
 
     Returns:
         Dictionary holding the measure's outputs.
@@ -149,7 +302,14 @@ def skewness(dist, **kwargs):
 
     logger.info("Calculating skewness ...")
 
-    output = w.measure_pipeline(s.skew, dist, **kwargs)
+    output = w.measure_pipeline(
+        s.skew,
+        dist,
+        streamed=Moments.skewness,
+        n_jobs=n_jobs,
+        executor=executor,
+        **kwargs,
+    )
 
     logger.info("Skewness calculated.")
     logger.debug(output)
@@ -157,11 +317,13 @@ def skewness(dist, **kwargs):
     return output
 
 
-def std(dist, **kwargs):
+def std(dist, n_jobs=None, executor=None, **kwargs):
     """Measures the standard deviation of a distribution.
 
     Args:
         dist (Distribution): Distribution to be analyzed.
+        n_jobs (int): Amount of threads used to measure the arguments (-1 uses every core).
+        executor (Executor): Executor used to measure the arguments.
 
     Returns:
         Dictionary holding the measure's outputs.
@@ -170,7 +332,9 @@ def std(dist, **kwargs):
 
     logger.info("Calculating standard deviation ...")
 
-    output = w.measure_pipeline(np.std, dist, **kwargs)
+    output = w.measure_pipeline(
+        np.std, dist, streamed=Moments.std, n_jobs=n_jobs, executor=executor, **kwargs
+    )
 
     logger.info("Standard deviation calculated.")
     logger.debug(output)
@@ -178,11 +342,13 @@ def std(dist, **kwargs):
     return output
 
 
-def var(dist, **kwargs):
+def var(dist, n_jobs=None, executor=None, **kwargs):
     """Measures the variance of a distribution.
 
     Args:
         dist (Distribution): Distribution to be analyzed.
+        n_jobs (int): Amount of threads used to measure the arguments (-1 uses every core).
+        executor (Executor): Executor used to measure the arguments.
 
     Returns:
         Dictionary holding the measure's outputs.
@@ -191,7 +357,9 @@ def var(dist, **kwargs):
 
     logger.info("Calculating variance ...")
 
-    output = w.measure_pipeline(np.var, dist, **kwargs)
+    output = w.measure_pipeline(
+        np.var, dist, streamed=Moments.var, n_jobs=n_jobs, executor=executor, **kwargs
+    )
 
     logger.info("Variance calculated.")
     logger.debug(output)
@@ -3,27 +3,58 @@
 
 import scipy.stats as s
 
+import statys.utils.kernels as k
 import statys.utils.wrappers as w
 from statys.utils import logging
 
 logger = logging.get_logger(__name__)
 
 
-def signed_rank(dist, alpha=0.05):
+def mirror_z(z, x, y):
+    """Mirrors the rank-sum statistic of (x, y) into the one of (y, x).
+
+    Args:
+        z (float): Statistic of (x, y).
+        x (np.ndarray): First sample.
+        y (np.ndarray): Second sample.
+
+    Returns:
+        Statistic of (y, x).
+
+    """
+
+    return -z
+
+
+def signed_rank(dist, alpha=0.05, as_matrix=False, n_jobs=None, control=None):
     """Performs the Wilcoxon signed-rank test.
 
     Args:
         dist (Distribution): Distribution to be analyzed.
         alpha (float): Significance value.
+        as_matrix (bool): Whether outputs should be dense matrices instead of a dictionary.
+        n_jobs (int): Amount of worker processes that run the scipy test pair-by-pair
+            instead of the vectorized kernel (-1 uses every core, while None or 1 keeps
+            the vectorized kernel).
+        control (str): Label of a control argument, which is only compared against the others.
 
     Returns:
-        Dictionary holding the test's outputs.
+        Dictionary (or PairwiseResult / ControlResult) holding the test's outputs.
 
     """
 
     logger.info("Performing Wilcoxon signed-rank test ...")
 
-    output = w.statistical_pipeline(s.wilcoxon, dist, alpha)
+    output = w.statistical_pipeline(
+        s.wilcoxon,
+        dist,
+        alpha,
+        symmetric=True,
+        kernel=k.SignedRankKernel if n_jobs in (None, 1) else None,
+        as_matrix=as_matrix,
+        n_jobs=n_jobs,
+        control=control,
+    )
 
     logger.info("Test performed.")
     logger.debug(output)
@@ -31,21 +62,36 @@ def signed_rank(dist, alpha=0.05):
     return output
 
 
-def rank_sum(dist, alpha=0.05):
+def rank_sum(dist, alpha=0.05, as_matrix=False, n_jobs=None, control=None):
     """Performs the Wilcoxon rank-sum test.
 
     Args:
         dist (Distribution): Distribution to be analyzed.
         alpha (float): Significance value.
+        as_matrix (bool): Whether outputs should be dense matrices instead of a dictionary.
+        n_jobs (int): Amount of worker processes that run the scipy test pair-by-pair
+            instead of the vectorized kernel (-1 uses every core, while None or 1 keeps
+            the vectorized kernel).
+        control (str): Label of a control argument, which is only compared against the others.
 
     Returns:
-        Dictionary holding the test's outputs.
+        Dictionary (or PairwiseResult / ControlResult) holding the test's outputs.
 
     """
 
     logger.info("Performing Wilcoxon rank-sum test ...")
 
-    output = w.statistical_pipeline(s.ranksums, dist, alpha)
+    output = w.statistical_pipeline(
+        s.ranksums,
+        dist,
+        alpha,
+        symmetric=True,
+        kernel=k.RankSumKernel if n_jobs in (None, 1) else None,
+        mirror=mirror_z,
+        as_matrix=as_matrix,
+        n_jobs=n_jobs,
+        control=control,
+    )
 
     logger.info("Test performed.")
     logger.debug(output)
@@ -0,0 +1,167 @@
+"""Memoization-based cache of measures' outputs.
+"""
+
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+import statys.utils.exception as e
+
+
+def _nbytes(value: Any) -> int:
+    """Estimates the amount of memory used by a measure's output.
+
+    Args:
+        value: Output to be measured.
+
+    Returns:
+        (int): Amount of bytes.
+
+    """
+
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v) for v in value)
+
+    return sys.getsizeof(value)
+
+
+class MeasureCache:
+    """A least-recently used cache of measures' outputs, keyed by the measure
+    function and its keyword arguments, and bounded both in entries and in memory.
+
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = 268435456
+    ) -> None:
+        """Initialization method.
+
+        Args:
+            max_entries: Maximum amount of cached outputs.
+            max_bytes: Maximum amount of memory used by cached outputs.
+
+        """
+
+        if max_entries <= 0:
+            raise e.ValueError("`max_entries` should be greater than 0")
+
+        if max_bytes <= 0:
+            raise e.ValueError("`max_bytes` should be greater than 0")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        """Amount of cached outputs.
+
+        Returns:
+            (int): Number of entries.
+
+        """
+
+        return len(self._entries)
+
+    @staticmethod
+    def _key(
+        measure: callable, kwargs: Dict[str, Any]
+    ) -> Optional[Tuple[Hashable, ...]]:
+        """Builds the key of a measure and its keyword arguments.
+
+        Args:
+            measure: Pointer to a measure function.
+            kwargs: Keyword arguments of the measure.
+
+        Returns:
+            (Optional[Tuple[Hashable, ...]]): Key of the entry or None if arguments are not hashable.
+
+        """
+
+        key = (measure, tuple(sorted(kwargs.items())))
+
+        try:
+            hash(key)
+
+        except TypeError:
+            return None
+
+        return key
+
+    def get(
+        self, measure: callable, kwargs: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Gathers a cached output.
+
+        Args:
+            measure: Pointer to a measure function.
+            kwargs: Keyword arguments of the measure.
+
+        Returns:
+            (Optional[Dict[str, Any]]): Cached output or None if it is not available.
+
+        """
+
+        key = self._key(measure, kwargs)
+
+        if key is None or key not in self._entries:
+            self.misses += 1
+
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+
+        return dict(self._entries[key][0])
+
+    def put(
+        self, measure: callable, kwargs: Dict[str, Any], output: Dict[str, Any]
+    ) -> None:
+        """Caches an output, evicting the least-recently used ones if needed.
+
+        Note that cached arrays are flagged as read-only, as they are shared between callers.
+
+        Args:
+            measure: Pointer to a measure function.
+            kwargs: Keyword arguments of the measure.
+            output: Output to be cached.
+
+        """
+
+        key = self._key(measure, kwargs)
+        nbytes = _nbytes(output)
+
+        if key is None or nbytes > self.max_bytes:
+            return
+
+        for value in output.values():
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[1]
+
+        self._entries[key] = (dict(output), nbytes)
+        self.nbytes += nbytes
+
+        while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+            _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+            self.nbytes -= evicted_nbytes
+
+    def clear(self) -> None:
+        """Invalidates every cached output."""
+
+        self._entries.clear()
+        self.nbytes = 0
@@ -1,6 +1,9 @@
 """Constants.
 """
 
+# Defines the amount of elements read at once when streaming over (memory-mapped) arrays
+CHUNK_SIZE = 1048576
+
 # Defines the critical values used in Friedman's post-hoc analysis
 # Significance values: 0.01, 0.05, 0.1
 CRITICAL_VALUES = {
@@ -0,0 +1,76 @@
+"""Critical values used in Friedman's post-hoc analysis, which are gathered from a
+precomputed table or from the studentized range distribution for any alpha and k.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+import scipy.stats as s
+
+import statys.utils.constants as c
+import statys.utils.exception as e
+
+# Significance values of the precomputed tables' columns
+ALPHAS = (0.01, 0.05, 0.1)
+
+# Precomputed tables, loaded only once as arrays, where row k - 1 holds the values of k treatments
+TABLES = {
+    post_hoc: np.asarray(values, dtype=np.float64)
+    for post_hoc, values in c.CRITICAL_VALUES.items()
+}
+
+
+@lru_cache(maxsize=1024)
+def _studentized_range(k: int, alpha: float) -> float:
+    """Computes the critical value of the studentized range distribution divided by the
+    square root of 2, i.e., the Nemenyi's critical value with infinite degrees of freedom.
+
+    Args:
+        k: Amount of treatments.
+        alpha: Significance value.
+
+    Returns:
+        (float): Critical value.
+
+    """
+
+    return float(s.studentized_range.ppf(1 - alpha, k, np.inf) / np.sqrt(2))
+
+
+def critical_value(
+    k: int, alpha: Optional[float] = 0.05, post_hoc: Optional[str] = "nemenyi"
+) -> float:
+    """Gathers the critical value of a post-hoc analysis.
+
+    Args:
+        k: Amount of treatments.
+        alpha: Significance value.
+        post_hoc: Type of post-hoc analysis.
+
+    Returns:
+        (float): Critical value.
+
+    """
+
+    if post_hoc not in TABLES and post_hoc != "bonferroni-dunn":
+        raise e.ValueError(
+            f"`post_hoc` should be one of {list(TABLES.keys()) + ['bonferroni-dunn']}"
+        )
+
+    if not 0 < alpha < 1:
+        raise e.ValueError("`alpha` should be between 0 and 1")
+
+    if k < 2:
+        return 0.0
+
+    if post_hoc == "bonferroni-dunn":
+        # Two-tailed normal critical value, with alpha divided by the k - 1 comparisons
+        return float(s.norm.isf(alpha / (2 * (k - 1))))
+
+    table = TABLES[post_hoc]
+
+    if k <= table.shape[0] and alpha in ALPHAS:
+        return float(table[k - 1, ALPHAS.index(alpha)])
+
+    return _studentized_range(int(k), float(alpha))
@@ -0,0 +1,401 @@
+"""Vectorized all-pairs kernels used to speed up the pairwise statistical tests.
+
+A kernel is built once over the distribution's samples (which is where any sorting
+or ranking happens) and then called with arrays of row and column indexes,
+returning the statistic and p-value of every requested (row, column) pair.
+
+Kernels also expose `pair_nbytes`, an estimate of the scratch memory used per pair,
+and `mirror`, which derives the statistics of the transposed grid of pairs.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import scipy.stats as s
+
+import statys.utils.constants as c
+import statys.utils.exception as e
+from statys.utils.ranks import rankdata
+
+
+class _RankKernel:
+    """Shared machinery of rank-based kernels, which sorts every sample only once
+    and computes the U statistic of a pair by searching one sample into the other.
+
+    """
+
+    # Scratch memory per pair, i.e., the float grids built by `_grid` and the tests
+    pair_nbytes = 64
+
+    def __init__(self, samples: List[np.ndarray]) -> None:
+        """Initialization method.
+
+        Args:
+            samples: Samples to be compared.
+
+        """
+
+        self.samples = [np.asarray(x, dtype=np.float64).ravel() for x in samples]
+        self.sizes = np.array([x.shape[0] for x in self.samples], dtype=np.float64)
+
+        # Sorts each sample once, keeping their unique values and tie counts
+        self.uniques, self.counts, self.cum_counts = [], [], []
+
+        for x in self.samples:
+            unique, count = np.unique(x, return_counts=True)
+
+            self.uniques.append(unique)
+            self.counts.append(count.astype(np.float64))
+            self.cum_counts.append(np.concatenate(([0], np.cumsum(count))))
+
+        self.ties = np.array([np.sum(c**3 - c) for c in self.counts])
+
+        # Pairs involving a sample with NaNs are propagated as NaN, following scipy
+        self.has_nan = np.array([np.isnan(x).any() for x in self.samples], dtype=bool)
+
+    def _pair(self, i: int, j: int) -> Tuple[float, float]:
+        """Computes the U statistic of a pair and the tie term of their combined sample.
+
+        Args:
+            i: Index of the first sample.
+            j: Index of the second sample.
+
+        Returns:
+            (Tuple[float, float]): U statistic of the first sample and combined tie term.
+
+        """
+
+        ux, cx = self.uniques[i], self.counts[i]
+        uy, cy = self.uniques[j], self.counts[j]
+
+        # Amount of `y` values smaller than (and equal to) each unique `x` value
+        position = np.searchsorted(uy, ux, side="left")
+        smaller = self.cum_counts[j][position]
+
+        clipped = np.minimum(position, uy.shape[0] - 1)
+        shared = (position < uy.shape[0]) & (uy[clipped] == ux)
+        equal = np.where(shared, cy[clipped], 0)
+
+        u = np.sum(cx * (smaller + 0.5 * equal))
+
+        # Tie term of the combined sample: (a + b)^3 - (a + b) = a^3 - a + b^3 - b + 3ab(a + b)
+        a, b = cx[shared], equal[shared]
+        ties = self.ties[i] + self.ties[j] + np.sum(3 * a * b * (a + b))
+
+        return u, ties
+
+    def _grid(
+        self, rows: np.ndarray, cols: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Computes the U statistics and tie terms of a grid of pairs.
+
+        Args:
+            rows: Indexes of the first samples.
+            cols: Indexes of the second samples.
+
+        Returns:
+            (Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]): U statistics, tie terms
+                and sizes of the first and second samples (diagonal cells and pairs
+                involving samples with NaNs are NaN).
+
+        """
+
+        rows, cols = np.asarray(rows), np.asarray(cols)
+
+        u = np.full((rows.shape[0], cols.shape[0]), np.nan)
+        ties = np.full_like(u, np.nan)
+
+        n1 = self.sizes[rows][:, None] * np.ones_like(u)
+        n2 = self.sizes[cols][None, :] * np.ones_like(u)
+
+        computed = {}
+
+        for r, i in enumerate(rows):
+            for c, j in enumerate(cols):
+                if i == j or self.has_nan[i] or self.has_nan[j]:
+                    continue
+
+                # Mirrored pairs are derived from U(j, i) = n_i * n_j - U(i, j)
+                if (j, i) in computed:
+                    u_ji, ties[r, c] = computed[(j, i)]
+                    u[r, c] = n1[r, c] * n2[r, c] - u_ji
+
+                else:
+                    u[r, c], ties[r, c] = computed[(i, j)] = self._pair(i, j)
+
+        return u, ties, n1, n2
+
+
+class MannWhitneyKernel(_RankKernel):
+    """All-pairs Mann-Whitney U test kernel, following `scipy.stats.mannwhitneyu`.
+
+    Pairs that scipy would test exactly (small samples without ties) fall back to it,
+    while the remaining ones use the tie-corrected normal approximation.
+
+    """
+
+    def __call__(
+        self, rows: np.ndarray, cols: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Performs the test over a grid of pairs.
+
+        Args:
+            rows: Indexes of the first samples.
+            cols: Indexes of the second samples.
+
+        Returns:
+            (Tuple[np.ndarray, np.ndarray]): Statistics and p-values of the pairs.
+
+        """
+
+        u, ties, n1, n2 = self._grid(rows, cols)
+
+        n = n1 + n2
+        mu = n1 * n2 / 2
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sigma = np.sqrt(n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1))))
+            z = (np.maximum(u, n1 * n2 - u) - mu - 0.5) / sigma
+
+        p = np.clip(2 * s.norm.sf(z), 0, 1)
+
+        # Small samples without ties are tested exactly by scipy
+        exact = ~((n1 > 8) & (n2 > 8)) & (ties == 0)
+
+        computed = {}
+
+        for r, c in zip(*np.nonzero(exact)):
+            i, j = rows[r], cols[c]
+
+            if (j, i) not in computed:
+                computed[(i, j)] = s.mannwhitneyu(self.samples[i], self.samples[j])[1]
+
+            p[r, c] = computed.get((i, j), computed.get((j, i)))
+
+        return u, p
+
+    def mirror(
+        self, statistic: np.ndarray, rows: np.ndarray, cols: np.ndarray
+    ) -> np.ndarray:
+        """Derives the statistics of the transposed grid, as U(j, i) = n_i * n_j - U(i, j).
+
+        Args:
+            statistic: Statistics of the (rows, cols) grid.
+            rows: Indexes of the first samples.
+            cols: Indexes of the second samples.
+
+        Returns:
+            (np.ndarray): Statistics of the (cols, rows) grid.
+
+        """
+
+        n1, n2 = self.sizes[np.asarray(rows)], self.sizes[np.asarray(cols)]
+
+        return n2[:, None] * n1[None, :] - statistic.T
+
+
+class RankSumKernel(_RankKernel):
+    """All-pairs Wilcoxon rank-sum test kernel, following `scipy.stats.ranksums`."""
+
+    def __call__(
+        self, rows: np.ndarray, cols: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Performs the test over a grid of pairs.
+
+        Args:
+            rows: Indexes of the first samples.
+            cols: Indexes of the second samples.
+
+        Returns:
+            (Tuple[np.ndarray, np.ndarray]): Statistics and p-values of the pairs.
+
+        """
+
+        u, _, n1, n2 = self._grid(rows, cols)
+
+        # Rank sum of the first sample in the combined sample
+        rank_sum = u + n1 * (n1 + 1) / 2
+        expected = n1 * (n1 + n2 + 1) / 2
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (rank_sum - expected) / np.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+
+        p = 2 * s.norm.sf(np.abs(z))
+
+        return z, p
+
+    def mirror(
+        self, statistic: np.ndarray, rows: np.ndarray, cols: np.ndarray
+    ) -> np.ndarray:
+        """Derives the statistics of the transposed grid, as z(j, i) = -z(i, j).
+
+        Args:
+            statistic: Statistics of the (rows, cols) grid.
+            rows: Indexes of the first samples.
+            cols: Indexes of the second samples.
+
+        Returns:
+            (np.ndarray): Statistics of the (cols, rows) grid.
+
+        """
+
+        return -statistic.T
+
+
+class SignedRankKernel:
+    """All-pairs Wilcoxon signed-rank test kernel, following `scipy.stats.wilcoxon`.
+
+    Pairwise differences are built only once per unordered pair and in chunks, being
+    ranked along an axis at once. Pairs that scipy would test exactly or by permutation
+    (small samples) fall back to it, while the remaining ones use the normal approximation.
+
+    """
+
+    def __init__(
+        self, samples: List[np.ndarray], chunk_size: Optional[int] = c.CHUNK_SIZE
+    ) -> None:
+        """Initialization method.
+
+        Args:
+            samples: Samples to be compared, which should have the same length.
+            chunk_size: Maximum amount of differences held in memory at once.
+
+        """
+
+        self.samples = [np.asarray(x, dtype=np.float64).ravel() for x in samples]
+
+        if len({x.shape[0] for x in self.samples}) > 1:
+            raise e.SizeError("`samples` should have the same length")
+
+        self.data = np.stack(self.samples) if self.samples else np.empty((0, 0))
+        self.chunk_size = chunk_size
+
+        # Scratch memory per pair, i.e., about eight arrays of differences
+        self.pair_nbytes = 64 * max(self.data.shape[1], 1)
+
+    def _pairs(
+        self, first: np.ndarray, second: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Computes the signed-rank sums of several pairs at once.
+
+        Args:
+            first: Indexes of the first samples.
+            second: Indexes of the second samples.
+
+        Returns:
+            (Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]): Positive and negative
+                rank sums, amount of non-zero differences and tie terms of each pair.
+
+        """
+
+        n = self.data.shape[1]
+
+        r_plus = np.zeros(first.shape[0])
+        r_minus = np.zeros_like(r_plus)
+        count = np.zeros_like(r_plus)
+        ties = np.zeros_like(r_plus)
+
+        step = max(1, self.chunk_size // max(n, 1))
+
+        for start in range(0, first.shape[0], step):
+            chunk = slice(start, start + step)
+
+            d = self.data[first[chunk]] - self.data[second[chunk]]
+            d_abs = np.abs(d)
+
+            # Zeros are discarded, being the smallest absolute values they only shift
+            # the ranks of the remaining differences by their amount
+            zeros = np.sum(d == 0, axis=1)
+            ranks = rankdata(d_abs, axis=1) - zeros[:, None]
+
+            r_plus[chunk] = np.sum(np.where(d > 0, ranks, 0), axis=1)
+            r_minus[chunk] = np.sum(np.where(d < 0, ranks, 0), axis=1)
+            count[chunk] = n - zeros
+
+            # Tie term is the sum of t^2 - 1 over every element of a tie group of size t
+            d_sorted = np.sort(d_abs, axis=1)
+            new_group = np.ones_like(d_sorted, dtype=bool)
+            new_group[:, 1:] = d_sorted[:, 1:] != d_sorted[:, :-1]
+
+            flat_starts = np.flatnonzero(new_group)
+            sizes = np.diff(np.append(flat_starts, new_group.size))
+            t = np.repeat(sizes, sizes).reshape(d_sorted.shape)
+
+            ties[chunk] = np.sum(np.where(d_sorted > 0, t * t - 1.0, 0), axis=1)
+
+        return r_plus, r_minus, count, ties
+
+    def __call__(
+        self, rows: np.ndarray, cols: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Performs the test over a grid of pairs.
+
+        Args:
+            rows: Indexes of the first samples.
+            cols: Indexes of the second samples.
+
+        Returns:
+            (Tuple[np.ndarray, np.ndarray]): Statistics and p-values of the pairs.
+
+        """
+
+        rows, cols = np.asarray(rows), np.asarray(cols)
+
+        statistic = np.full((rows.shape[0], cols.shape[0]), np.nan)
+        p = np.full_like(statistic, np.nan)
+
+        # Gathers each unordered pair only once, as the two-sided test is symmetric
+        grid_rows, grid_cols = np.meshgrid(rows, cols, indexing="ij")
+        valid = grid_rows != grid_cols
+        pairs = np.unique(
+            np.sort(np.stack((grid_rows[valid], grid_cols[valid]), axis=1), axis=1),
+            axis=0,
+        ).reshape(-1, 2)
+
+        r_plus, r_minus, count, ties = self._pairs(pairs[:, 0], pairs[:, 1])
+
+        mn = count * (count + 1) * 0.25
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            se = np.sqrt((count * (count + 1) * (2 * count + 1) - ties / 2) / 24)
+            z = (r_plus - mn) / se
+
+        pair_statistic = np.minimum(r_plus, r_minus)
+        pair_p = 2 * s.norm.sf(np.abs(z))
+
+        # Only pairs with more than 50 non-zero differences are asymptotic under every
+        # supported scipy release, thus the remaining ones are delegated to scipy
+        asymptotic = count > 50
+
+        for m in np.flatnonzero(~asymptotic):
+            i, j = pairs[m]
+
+            pair_statistic[m], pair_p[m] = s.wilcoxon(self.samples[i], self.samples[j])
+
+        # Scatters the pairs' outputs into both (i, j) and (j, i) cells
+        lookup = {(i, j): m for m, (i, j) in enumerate(pairs)}
+
+        for r, c in zip(*np.nonzero(valid)):
+            i, j = sorted((rows[r], cols[c]))
+            m = lookup[(i, j)]
+
+            statistic[r, c], p[r, c] = pair_statistic[m], pair_p[m]
+
+        return statistic, p
+
+    def mirror(
+        self, statistic: np.ndarray, rows: np.ndarray, cols: np.ndarray
+    ) -> np.ndarray:
+        """Derives the statistics of the transposed grid, which are symmetric.
+
+        Args:
+            statistic: Statistics of the (rows, cols) grid.
+            rows: Indexes of the first samples.
+            cols: Indexes of the second samples.
+
+        Returns:
+            (np.ndarray): Statistics of the (cols, rows) grid.
+
+        """
+
+        return statistic.T
@@ -0,0 +1,288 @@
+"""Sufficient statistics (moments) that can be merged and updated incrementally.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+import statys.utils.constants as c
+
+
+class Moments:
+    """A class that holds the running moments of a sample, i.e., its count, mean,
+    central sums of powers (up to the fourth order), minimum and maximum.
+
+    Moments are merged with Pébay's pairwise update formulae, which allow
+    computing them over chunks or streams without re-scanning the data.
+
+    """
+
+    __slots__ = ("n", "mu", "m2", "m3", "m4", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        """Initialization method."""
+
+        self.n = 0
+        self.mu = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    def __repr__(self) -> str:
+        """Class' string representation.
+
+        Returns:
+            (str): String representation.
+
+        """
+
+        return (
+            f"Moments(n={self.n}, mean={self.mu}, m2={self.m2}, m3={self.m3}, "
+            f"m4={self.m4}, min={self.minimum}, max={self.maximum})"
+        )
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> "Moments":
+        """Computes the moments of an in-memory array with vectorized operations.
+
+        Args:
+            values: Array of values.
+
+        Returns:
+            (Moments): Moments of the array.
+
+        """
+
+        values = np.asarray(values, dtype=np.float64).ravel()
+
+        moments = cls()
+
+        if values.size == 0:
+            return moments
+
+        moments.n = values.size
+        moments.mu = float(np.mean(values))
+
+        deviation = values - moments.mu
+        deviation_2 = deviation * deviation
+
+        moments.m2 = float(np.sum(deviation_2))
+        moments.m3 = float(np.dot(deviation_2, deviation))
+        moments.m4 = float(np.dot(deviation_2, deviation_2))
+        moments.minimum = float(np.min(values))
+        moments.maximum = float(np.max(values))
+
+        return moments
+
+    @classmethod
+    def from_chunks(
+        cls, values: np.ndarray, chunk_size: Optional[int] = c.CHUNK_SIZE
+    ) -> "Moments":
+        """Computes the moments of an array by streaming over chunks of it, which
+        bounds the memory used by large (memory-mapped) arrays.
+
+        Args:
+            values: Array of values.
+            chunk_size: Amount of elements read at once.
+
+        Returns:
+            (Moments): Moments of the array.
+
+        """
+
+        values = values.reshape(-1)
+
+        moments = cls()
+
+        for start in range(0, values.shape[0], chunk_size):
+            moments.update(values[start : start + chunk_size])
+
+        return moments
+
+    def merge(self, other: "Moments") -> "Moments":
+        """Merges another set of moments into the current one.
+
+        Args:
+            other: Moments to be merged.
+
+        Returns:
+            (Moments): The updated moments.
+
+        """
+
+        if other.n == 0:
+            return self
+
+        if self.n == 0:
+            for slot in self.__slots__:
+                setattr(self, slot, getattr(other, slot))
+
+            return self
+
+        n_a, n_b = self.n, other.n
+        n = n_a + n_b
+
+        delta = other.mu - self.mu
+        delta_n = delta / n
+        delta_n_2 = delta_n * delta_n
+
+        m2 = self.m2 + other.m2 + delta * delta_n * n_a * n_b
+        m3 = (
+            self.m3
+            + other.m3
+            + delta * delta_n_2 * n_a * n_b * (n_a - n_b)
+            + 3 * delta_n * (n_a * other.m2 - n_b * self.m2)
+        )
+        m4 = (
+            self.m4
+            + other.m4
+            + delta
+            * delta_n
+            * delta_n_2
+            * n_a
+            * n_b
+            * (n_a * n_a - n_a * n_b + n_b * n_b)
+            + 6 * delta_n_2 * (n_a * n_a * other.m2 + n_b * n_b * self.m2)
+            + 4 * delta_n * (n_a * other.m3 - n_b * self.m3)
+        )
+
+        self.n = n
+        self.mu += delta_n * n_b
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+        return self
+
+    def update(self, values: np.ndarray) -> "Moments":
+        """Updates the moments with a new batch of values.
+
+        Args:
+            values: Array of values.
+
+        Returns:
+            (Moments): The updated moments.
+
+        """
+
+        return self.merge(Moments.from_array(values))
+
+    def mean(self) -> float:
+        """Mean of the sample.
+
+        Returns:
+            (float): Mean value.
+
+        """
+
+        if self.n == 0:
+            return np.nan
+
+        return self.mu
+
+    def var(self, ddof: Optional[int] = 0) -> float:
+        """Variance of the sample.
+
+        Args:
+            ddof: Delta degrees of freedom.
+
+        Returns:
+            (float): Variance value.
+
+        """
+
+        if self.n - ddof <= 0:
+            return np.nan
+
+        return self.m2 / (self.n - ddof)
+
+    def std(self, ddof: Optional[int] = 0) -> float:
+        """Standard deviation of the sample.
+
+        Args:
+            ddof: Delta degrees of freedom.
+
+        Returns:
+            (float): Standard deviation value.
+
+        """
+
+        return np.sqrt(self.var(ddof))
+
+    def skewness(self, bias: Optional[bool] = True) -> float:
+        """Skewness of the sample, following `scipy.stats.skew`.
+
+        Args:
+            bias: Whether calculation should not be corrected for statistical bias.
+
+        Returns:
+            (float): Skewness value.
+
+        """
+
+        if self.n == 0 or self.m2 == 0:
+            return np.nan
+
+        m2, m3 = self.m2 / self.n, self.m3 / self.n
+        g1 = m3 / m2**1.5
+
+        if not bias and self.n > 2:
+            g1 *= np.sqrt((self.n - 1.0) * self.n) / (self.n - 2.0)
+
+        return g1
+
+    def kurtosis(
+        self, fisher: Optional[bool] = True, bias: Optional[bool] = True
+    ) -> float:
+        """Kurtosis of the sample, following `scipy.stats.kurtosis`.
+
+        Args:
+            fisher: Whether Fisher's (excess) or Pearson's definition should be used.
+            bias: Whether calculation should not be corrected for statistical bias.
+
+        Returns:
+            (float): Kurtosis value.
+
+        """
+
+        if self.n == 0 or self.m2 == 0:
+            return np.nan
+
+        m2, m4 = self.m2 / self.n, self.m4 / self.n
+        g2 = m4 / m2**2
+
+        if not bias and self.n > 3:
+            n = self.n
+            g2 = ((n * n - 1.0) * g2 - 3 * (n - 1.0) ** 2.0) / (
+                (n - 2.0) * (n - 3.0)
+            ) + 3.0
+
+        return g2 - 3.0 if fisher else g2
+
+    def min(self) -> float:
+        """Minimum value of the sample.
+
+        Returns:
+            (float): Minimum value.
+
+        """
+
+        if self.n == 0:
+            return np.nan
+
+        return self.minimum
+
+    def max(self) -> float:
+        """Maximum value of the sample.
+
+        Returns:
+            (float): Maximum value.
+
+        """
+
+        if self.n == 0:
+            return np.nan
+
+        return self.maximum
@@ -0,0 +1,234 @@
+"""Process-based parallelism helpers, which share the distribution's samples
+through `multiprocessing.shared_memory` instead of pickling them per task.
+"""
+
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+import statys.utils.exception as e
+
+# Samples and test attached by each worker process
+_SHARED = {}
+
+
+class SharedSamples:
+    """A class that copies samples, only once, into a single shared memory block,
+    which is laid out as a flat buffer indexed by an offsets array.
+
+    """
+
+    def __init__(self, samples: List[np.ndarray]) -> None:
+        """Initialization method.
+
+        Args:
+            samples: Samples to be shared.
+
+        """
+
+        samples = [np.asarray(x, dtype=np.float64).ravel() for x in samples]
+
+        self.offsets = np.zeros(len(samples) + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum([x.shape[0] for x in samples])
+
+        # Shared memory blocks can not be empty
+        size = max(int(self.offsets[-1]) * 8, 8)
+        self.shm = SharedMemory(create=True, size=size)
+
+        buffer = np.ndarray((self.offsets[-1],), dtype=np.float64, buffer=self.shm.buf)
+        for i, x in enumerate(samples):
+            buffer[self.offsets[i] : self.offsets[i + 1]] = x
+
+    def __enter__(self) -> "SharedSamples":
+        """Enters the context, returning the shared samples.
+
+        Returns:
+            (SharedSamples): Shared samples.
+
+        """
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Exits the context, releasing the shared memory block."""
+
+        self.close()
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+
+        return self.shm.name
+
+    def close(self) -> None:
+        """Releases and destroys the shared memory block."""
+
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _attach(name: str, offsets: np.ndarray, test: callable) -> None:
+    """Attaches a worker process to the shared samples (pool's initializer).
+
+    Args:
+        name: Name of the shared memory block.
+        offsets: Offsets of each sample in the flat buffer.
+        test: Pointer to a statistical test.
+
+    """
+
+    shm = SharedMemory(name=name)
+    buffer = np.ndarray((offsets[-1],), dtype=np.float64, buffer=shm.buf)
+
+    _SHARED["shm"] = shm
+    _SHARED["test"] = test
+    _SHARED["samples"] = [
+        buffer[offsets[i] : offsets[i + 1]] for i in range(offsets.shape[0] - 1)
+    ]
+
+
+def _test_block(pairs: np.ndarray) -> np.ndarray:
+    """Performs the attached test over a block of pairs.
+
+    Args:
+        pairs: Block of (i, j) pairs.
+
+    Returns:
+        (np.ndarray): Statistics and p-values of the pairs.
+
+    """
+
+    test, samples = _SHARED["test"], _SHARED["samples"]
+
+    output = np.empty((pairs.shape[0], 2))
+
+    for m, (i, j) in enumerate(pairs):
+        statistic, p = test(samples[i], samples[j])
+        output[m] = statistic, p
+
+    return output
+
+
+class PairwisePool:
+    """A pool of worker processes attached to shared samples, which performs a
+    statistical test over blocks of pairs and can be reused across several calls.
+
+    """
+
+    def __init__(
+        self,
+        test: callable,
+        samples: List[np.ndarray],
+        n_jobs: Optional[int] = -1,
+        start_method: Optional[str] = None,
+    ) -> None:
+        """Initialization method.
+
+        Args:
+            test: Pointer to a (picklable) statistical test.
+            samples: Samples to be compared.
+            n_jobs: Amount of worker processes (-1 uses every core).
+            start_method: Start method of the worker processes (defaults to the platform's).
+
+        """
+
+        if n_jobs == -1:
+            n_jobs = os.cpu_count()
+
+        if n_jobs < 1:
+            raise e.ValueError("`n_jobs` should be -1 or greater than 0")
+
+        self.n_jobs = n_jobs
+
+        self.shared = SharedSamples(samples)
+        self.pool = ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=mp.get_context(start_method),
+            initializer=_attach,
+            initargs=(self.shared.name, self.shared.offsets, test),
+        )
+
+    def __enter__(self) -> "PairwisePool":
+        """Enters the context, returning the pool.
+
+        Returns:
+            (PairwisePool): Pool of worker processes.
+
+        """
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Exits the context, shutting down workers and releasing the shared samples."""
+
+        self.close()
+
+    def map(
+        self, pairs: List[Tuple[int, int]], block_size: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Performs the test over pairs of samples, following the order of `pairs`.
+
+        Args:
+            pairs: Pairs of samples' indexes to be tested.
+            block_size: Amount of pairs per task (defaults to four tasks per worker).
+
+        Returns:
+            (Tuple[np.ndarray, np.ndarray]): Statistics and p-values of the pairs.
+
+        """
+
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+
+        if pairs.shape[0] == 0:
+            return np.empty(0), np.empty(0)
+
+        if block_size is None:
+            block_size = max(1, -(-pairs.shape[0] // (4 * self.n_jobs)))
+
+        blocks = [
+            pairs[i : i + block_size] for i in range(0, pairs.shape[0], block_size)
+        ]
+
+        output = np.concatenate(list(self.pool.map(_test_block, blocks)))
+
+        return output[:, 0], output[:, 1]
+
+    def close(self) -> None:
+        """Shuts down the workers and releases the shared samples."""
+
+        self.pool.shutdown()
+        self.shared.close()
+
+
+def pairwise_map(
+    test: callable,
+    samples: List[np.ndarray],
+    pairs: List[Tuple[int, int]],
+    n_jobs: Optional[int] = -1,
+    block_size: Optional[int] = None,
+    start_method: Optional[str] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Performs a statistical test over pairs of samples with a pool of processes.
+
+    Samples are placed into shared memory once, and workers receive blocks of pairs,
+    so samples are never pickled per task. Outputs follow the order of `pairs`.
+
+    Args:
+        test: Pointer to a (picklable) statistical test.
+        samples: Samples to be compared.
+        pairs: Pairs of samples' indexes to be tested.
+        n_jobs: Amount of worker processes (-1 uses every core).
+        block_size: Amount of pairs per task (defaults to four tasks per worker).
+        start_method: Start method of the worker processes (defaults to the platform's).
+
+    Returns:
+        (Tuple[np.ndarray, np.ndarray]): Statistics and p-values of the pairs.
+
+    """
+
+    with PairwisePool(test, samples, n_jobs, start_method) as pool:
+        return pool.map(pairs, block_size)
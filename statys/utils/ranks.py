@@ -0,0 +1,88 @@
+"""Tie-aware ranking, shared by the measures, kernels and Friedman-related tests.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+import statys.utils.exception as e
+
+
+def rankdata(
+    values: np.ndarray,
+    axis: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    doubled: Optional[bool] = False,
+) -> np.ndarray:
+    """Ranks an array along an axis, assigning average ranks to ties, with a single
+    sort followed by the detection of runs of equal values.
+
+    Args:
+        values: Array of values.
+        axis: Axis to be ranked (the flattened array is ranked if None).
+        out: Buffer where ranks are written (float64 or, if doubled, int32).
+        doubled: Whether ranks should be stored as int32 doubled ranks, which
+            are exact for half-integer ranks and use half of the memory.
+
+    Returns:
+        (np.ndarray): Array of (doubled) ranks.
+
+    """
+
+    values = np.asarray(values)
+
+    if axis is None:
+        values, axis = values.ravel(), -1
+
+    dtype = np.int32 if doubled else np.float64
+
+    if out is None:
+        out = np.empty(values.shape, dtype)
+
+    elif out.shape != values.shape or out.dtype != dtype:
+        raise e.SizeError(
+            f"`out` should be a {values.shape} array of {np.dtype(dtype)}"
+        )
+
+    if values.size == 0:
+        return out
+
+    moved = np.moveaxis(values, axis, -1)
+    n = moved.shape[-1]
+    data = moved.reshape(-1, n)
+
+    order = np.argsort(data, axis=1)
+    sorted_data = np.take_along_axis(data, order, axis=1)
+
+    # Runs of equal values (which never cross rows) share the average of their ranks,
+    # i.e., a run of `count` values starting at position `start` has doubled rank 2 * start + count + 1
+    new_run = np.ones(data.shape, dtype=bool)
+    new_run[:, 1:] = sorted_data[:, 1:] != sorted_data[:, :-1]
+
+    starts = np.flatnonzero(new_run)
+    counts = np.diff(np.append(starts, new_run.size))
+    ranks = np.repeat((2 * (starts % n) + counts + 1).astype(dtype), counts)
+
+    # Writes straight into the buffer whenever it can be viewed as the ranked rows
+    target = np.moveaxis(out, axis, -1).reshape(data.shape)
+    direct = np.may_share_memory(target, out)
+
+    if not direct:
+        target = np.empty(data.shape, dtype)
+
+    np.put_along_axis(target, order, ranks.reshape(data.shape), axis=1)
+
+    if not doubled:
+        target *= 0.5
+
+        if np.issubdtype(data.dtype, np.floating):
+            # Rows holding NaNs are propagated, following `scipy.stats.rankdata`
+            target[np.isnan(sorted_data[:, -1])] = np.nan
+
+    elif np.issubdtype(data.dtype, np.floating) and np.isnan(sorted_data[:, -1]).any():
+        raise e.ValueError("`values` should not hold NaNs when ranks are doubled")
+
+    if not direct:
+        np.moveaxis(out, axis, -1)[...] = target.reshape(moved.shape)
+
+    return out
@@ -1,10 +1,19 @@
 """Wraps common-based functions for easier development.
 """
 
+import math
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from typing import Any, Dict
+import numpy as np
 
-from statys.core.distribution import Distribution
+import statys.utils.constants as c
+import statys.utils.exception as e
+import statys.utils.parallel as parallel
+from statys.core.distribution import Distribution, StreamingDistribution
+from statys.core.pairwise import ControlResult, PairwiseResult, calculate_hypotheses
+from statys.utils.moments import Moments
 
 
 def calculate_hypothesis(p: float, alpha: float) -> bool:
@@ -30,12 +39,119 @@ def calculate_hypothesis(p: float, alpha: float) -> bool:
     return h
 
 
-def measure_pipeline(measure: callable, dist: Distribution, **kwargs) -> Dict[str, Any]:
+def parallel_map(
+    function: callable,
+    iterable: Iterable[Any],
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[Any]:
+    """Maps a function over an iterable, possibly dispatching calls to a pool of threads.
+
+    Note that outputs are always returned in the same order as the inputs.
+
+    Args:
+        function: Pointer to the function to be mapped.
+        iterable: Inputs of the function.
+        n_jobs: Amount of threads (-1 uses every core, while None or 1 runs serially).
+        executor: Executor used to dispatch calls (takes precedence over `n_jobs`).
+
+    Returns:
+        (List[Any]): Outputs of the function.
+
+    """
+
+    if executor is not None:
+        return list(executor.map(function, iterable))
+
+    if n_jobs is None or n_jobs == 1:
+        return [function(value) for value in iterable]
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+
+    if n_jobs < 1:
+        raise e.ValueError("`n_jobs` should be -1 or greater than 0")
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        return list(pool.map(function, iterable))
+
+
+def _is_streamable(value: Any, kwargs: Dict[str, Any]) -> bool:
+    """Checks whether a value should be streamed in chunks instead of fully read.
+
+    Args:
+        value: Value to be checked.
+        kwargs: Keyword arguments of the measure.
+
+    Returns:
+        (bool): Whether value is a one-dimensional memory-mapped array reduced as a whole.
+
+    """
+
+    return (
+        isinstance(value, np.memmap)
+        and value.ndim == 1
+        and kwargs.get("axis", None) in (None, 0, -1)
+    )
+
+
+def measure_pipeline(
+    measure: callable,
+    dist: Distribution,
+    streamed: Optional[callable] = None,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    **kwargs,
+) -> Dict[str, Any]:
     """Wraps the pipeline of conducting a measure.
 
+    Note that outputs are memoized whenever the distribution's cache is enabled.
+
+    Args:
+        measure: Pointer to a measure function.
+        dist: Distribution to be analyzed.
+        streamed: Pointer to a measure over `Moments`, used by streaming distributions
+            and to stream memory-mapped arrays in chunks.
+        n_jobs: Amount of threads used to measure the arguments (-1 uses every core).
+        executor: Executor used to measure the arguments (takes precedence over `n_jobs`).
+
+    Returns:
+        (Dict[str, Any]): Test's outputs.
+
+    """
+
+    cache = getattr(dist, "cache", None)
+
+    if cache is not None:
+        output = cache.get(measure, kwargs)
+
+        if output is not None:
+            return output
+
+    output = _measure_pipeline(measure, dist, streamed, n_jobs, executor, **kwargs)
+
+    if cache is not None:
+        cache.put(measure, kwargs, output)
+
+    return output
+
+
+def _measure_pipeline(
+    measure: callable,
+    dist: Distribution,
+    streamed: Optional[callable] = None,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """Conducts a measure over every argument of a distribution, without caching.
+
     Args:
         measure: Pointer to a measure function.
         dist: Distribution to be analyzed.
+        streamed: Pointer to a measure over `Moments`.
+        n_jobs: Amount of threads used to measure the arguments.
+        executor: Executor used to measure the arguments.
 
     Returns:
         (Dict[str, Any]): Test's outputs.
@@ -44,40 +160,414 @@ def measure_pipeline(measure: callable, dist: Distribution, **kwargs) -> Dict[st
 
     output = {}
 
-    for (attr, value) in dist.attrs:
-        output[attr] = measure(value, **kwargs)
+    if streamed and isinstance(dist, StreamingDistribution):
+        if kwargs.get("axis", None) in (None, 0, -1):
+            # Running moments answer the measure without re-scanning the data
+            streamed_kwargs = {k: v for k, v in kwargs.items() if k != "axis"}
+
+            for (attr, moments) in dist.moments:
+                output[attr] = streamed(moments, **streamed_kwargs)
+
+            return output
+
+    def _measure(value: Any) -> Any:
+        if streamed and _is_streamable(value, kwargs):
+            streamed_kwargs = {k: v for k, v in kwargs.items() if k != "axis"}
+            moments = Moments.from_chunks(value, c.CHUNK_SIZE)
+
+            return streamed(moments, **streamed_kwargs)
+
+        return measure(value, **kwargs)
+
+    attrs = list(dist.attrs)
+    values = parallel_map(_measure, [value for _, value in attrs], n_jobs, executor)
+
+    for (attr, _), value in zip(attrs, values):
+        output[attr] = value
 
     return output
 
 
+def iter_pairs(
+    test: callable,
+    dist: Distribution,
+    alpha: float,
+    symmetric: Optional[bool] = False,
+    kernel: Optional[callable] = None,
+    mirror: Optional[callable] = None,
+    stop: Optional[callable] = None,
+) -> Iterator[Tuple[int, int, float, float, int]]:
+    """Lazily conducts a statistical test over every pair of arguments, yielding each
+    record as soon as it is computed (memory does not grow with the amount of pairs).
+
+    Args:
+        test: Pointer to a statistical test.
+        dist: Distribution to be analyzed.
+        alpha: Significance value.
+        symmetric: Whether test's p-value is symmetric, i.e., (j, i) is yielded right after
+            (i, j) without being tested.
+        kernel: Pointer to a vectorized all-pairs kernel that replaces the calls to the test.
+        mirror: Pointer to a function that maps the statistic of (i, j) and the pair's
+            values into the statistic of (j, i) (statistic is kept if not supplied),
+            e.g., `mann_whitney.mirror_u` or `wilcoxon.mirror_z`.
+        stop: Pointer to a function that receives a record and returns whether the
+            iteration should stop after yielding it.
+
+    Yields:
+        (Tuple[int, int, float, float, int]): Indexes, statistic, p-value and hypothesis
+            of a pair of arguments.
+
+    """
+
+    samples = [value for _, value in dist.attrs]
+    n_attrs = len(samples)
+
+    if kernel is not None:
+        kernel = kernel(samples)
+
+    def _record(i: int, j: int) -> Tuple[int, int, float, float, int]:
+        if kernel is not None:
+            statistic, p = kernel(np.array([i]), np.array([j]))
+            statistic, p = statistic[0, 0], p[0, 0]
+
+        else:
+            statistic, p = test(samples[i], samples[j])
+
+        return i, j, statistic, p, calculate_hypothesis(p, alpha)
+
+    for i in range(n_attrs):
+        for j in range(i + 1 if symmetric else 0, n_attrs):
+            if i == j:
+                continue
+
+            record = _record(i, j)
+            records = [record]
+
+            if symmetric:
+                statistic = record[2]
+
+                if mirror:
+                    statistic = mirror(statistic, samples[i], samples[j])
+
+                records.append((j, i, statistic, record[3], record[4]))
+
+            for record in records:
+                yield record
+
+                if stop is not None and stop(record):
+                    return
+
+
+def _allocate(
+    n_attrs: int, out: Optional[str] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Preallocates the statistic, p-value and hypothesis matrices of a pairwise test.
+
+    Args:
+        n_attrs: Amount of arguments.
+        out: Directory where matrices are memory-mapped as `.npy` files (in-memory if None).
+
+    Returns:
+        (Tuple[np.ndarray, np.ndarray, np.ndarray]): Statistic, p-value and hypothesis matrices.
+
+    """
+
+    shape = (n_attrs, n_attrs)
+
+    if out is None:
+        return np.full(shape, np.nan), np.full(shape, np.nan), np.zeros(shape, int)
+
+    os.makedirs(out, exist_ok=True)
+
+    matrices = []
+
+    for (name, dtype, fill) in (
+        ("statistic", np.float64, np.nan),
+        ("p", np.float64, np.nan),
+        ("h", int, 0),
+    ):
+        matrix = np.lib.format.open_memmap(
+            os.path.join(out, f"{name}.npy"), mode="w+", dtype=dtype, shape=shape
+        )
+        matrix[:] = fill
+        matrices.append(matrix)
+
+    return tuple(matrices)
+
+
+def _tiles(
+    n_attrs: int, tile_size: int, symmetric: Optional[bool] = False
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Splits the k x k pair space into square tiles.
+
+    Args:
+        n_attrs: Amount of arguments.
+        tile_size: Amount of rows (and columns) of each tile.
+        symmetric: Whether only tiles on and above the diagonal should be yielded.
+
+    Yields:
+        (Tuple[np.ndarray, np.ndarray]): Rows and columns indexes of a tile.
+
+    """
+
+    for row in range(0, n_attrs, tile_size):
+        rows = np.arange(row, min(row + tile_size, n_attrs))
+
+        for col in range(row if symmetric else 0, n_attrs, tile_size):
+            yield rows, np.arange(col, min(col + tile_size, n_attrs))
+
+
 def statistical_pipeline(
-    test: callable, dist: Distribution, alpha: float
-) -> Dict[str, Any]:
+    test: callable,
+    dist: Distribution,
+    alpha: float,
+    symmetric: Optional[bool] = False,
+    kernel: Optional[callable] = None,
+    mirror: Optional[callable] = None,
+    as_matrix: Optional[bool] = False,
+    n_jobs: Optional[int] = None,
+    memory_budget: Optional[int] = None,
+    out: Optional[str] = None,
+    control: Optional[Union[str, int]] = None,
+) -> Union[Dict[str, Any], PairwiseResult, ControlResult]:
     """Wraps the pipeline of conducting a statistical test and calculating its hypothesis.
 
+    Note that the k x k pair space is processed in tiles whose scratch memory is bounded
+    by `memory_budget`, while outputs are written into preallocated (or memory-mapped) matrices.
+
     Args:
         test: Pointer to a statistical test.
         dist: Distribution to be analyzed.
         alpha: Significance value.
+        symmetric: Whether test's p-value is symmetric, i.e., only pairs (i, j) with i < j
+            are tested and mirrored pairs are filled by symmetry.
+        kernel: Pointer to a vectorized all-pairs kernel (from `statys.utils.kernels`)
+            that replaces the pair-by-pair calls to the test.
+        mirror: Pointer to a function that maps the statistic of (i, j) and the pair's
+            values into the statistic of (j, i) (statistic is kept if not supplied).
+        as_matrix: Whether outputs should be dense k x k matrices instead of a dictionary.
+        n_jobs: Amount of worker processes that perform the pair-by-pair tests over shared
+            memory (-1 uses every core, while None or 1 runs serially).
+        memory_budget: Maximum amount of scratch memory (in bytes) used by each tile
+            (the whole pair space is a single tile if None).
+        out: Directory where the statistic, p-value and hypothesis matrices are
+            memory-mapped as `.npy` files (kept in memory if None).
+        control: Label (or index) of a control argument, which is only compared against
+            the remaining ones, i.e., k - 1 tests instead of k x (k - 1).
 
     Returns:
-        (Dict[str, Any]): Test's outputs.
+        (Union[Dict[str, Any], PairwiseResult, ControlResult]): Test's outputs.
+
+    """
+
+    if control is not None:
+        return _control_pipeline(test, dist, alpha, control, kernel, as_matrix, n_jobs)
+
+    if memory_budget is not None and memory_budget <= 0:
+        raise e.ValueError("`memory_budget` should be greater than 0")
+
+    attrs = list(dist.attrs)
+    samples = [value for _, value in attrs]
+    n_attrs = len(attrs)
+
+    statistic, p, h = _allocate(n_attrs, out)
+
+    if kernel is not None:
+        kernel = kernel(samples)
+        pair_nbytes = getattr(kernel, "pair_nbytes", 64)
+
+    else:
+        # Scratch memory per pair, i.e., its indexes and outputs
+        pair_nbytes = 64
+
+    if memory_budget is None:
+        tile_size = max(n_attrs, 1)
+
+    else:
+        # Each cell also holds its statistic and p-value until it is written
+        tile_size = max(1, math.isqrt(memory_budget // (pair_nbytes + 16)))
+
+    pool = None
+
+    if kernel is None and not (n_jobs is None or n_jobs == 1):
+        pool = parallel.PairwisePool(test, samples, n_jobs)
+
+    try:
+        for rows, cols in _tiles(n_attrs, tile_size, symmetric):
+            tile = np.ix_(rows, cols)
+
+            if kernel is not None:
+                tile_statistic, tile_p = kernel(rows, cols)
+
+                statistic[tile], p[tile] = tile_statistic, tile_p
+
+                # Tiles below the diagonal are derived from the computed ones
+                if symmetric and rows[0] != cols[0]:
+                    mirrored = np.ix_(cols, rows)
+
+                    if hasattr(kernel, "mirror"):
+                        statistic[mirrored] = kernel.mirror(tile_statistic, rows, cols)
+                        p[mirrored] = tile_p.T
+
+                    else:
+                        statistic[mirrored], p[mirrored] = kernel(cols, rows)
+
+                continue
+
+            # Mirrored pairs of symmetric tests are not tested
+            pairs = [
+                (i, j)
+                for i in rows
+                for j in cols
+                if i != j and not (symmetric and j < i)
+            ]
+
+            if pool is None:
+                for i, j in pairs:
+                    statistic[i, j], p[i, j] = test(samples[i], samples[j])
+
+            elif pairs:
+                i, j = tuple(np.asarray(pairs, dtype=int).T)
+
+                statistic[i, j], p[i, j] = pool.map(pairs)
+
+            if symmetric:
+                for i, j in pairs:
+                    p[j, i] = p[i, j]
+                    statistic[j, i] = (
+                        mirror(statistic[i, j], samples[i], samples[j])
+                        if mirror
+                        else statistic[i, j]
+                    )
+
+    finally:
+        if pool is not None:
+            pool.close()
+
+    # Hypotheses are also gathered per tile, avoiding a full-sized temporary
+    for rows, cols in _tiles(n_attrs, tile_size):
+        tile = np.ix_(rows, cols)
+
+        h[tile] = calculate_hypotheses(p[tile], alpha)
+
+    np.fill_diagonal(h, 0)
+
+    if out is not None:
+        for matrix in (statistic, p, h):
+            matrix.flush()
+
+    return pairwise_output(
+        [attr for attr, _ in attrs], statistic, p, alpha, as_matrix, h
+    )
+
+
+def _control_pipeline(
+    test: callable,
+    dist: Distribution,
+    alpha: float,
+    control: Union[str, int],
+    kernel: Optional[callable] = None,
+    as_matrix: Optional[bool] = False,
+    n_jobs: Optional[int] = None,
+) -> Union[Dict[str, Any], ControlResult]:
+    """Conducts a statistical test between a control argument and every other argument.
+
+    Args:
+        test: Pointer to a statistical test.
+        dist: Distribution to be analyzed.
+        alpha: Significance value.
+        control: Label (or index) of the control argument.
+        kernel: Pointer to a vectorized all-pairs kernel.
+        as_matrix: Whether outputs should be vectors instead of a dictionary.
+        n_jobs: Amount of worker processes that perform the pair-by-pair tests.
+
+    Returns:
+        (Union[Dict[str, Any], ControlResult]): Test's outputs.
 
     """
 
+    attrs = list(dist.attrs)
+    labels = [attr for attr, _ in attrs]
+    samples = [value for _, value in attrs]
+
+    if isinstance(control, str):
+        if control not in labels:
+            raise e.ValueError(f"`control` should be one of {labels}")
+
+        control = labels.index(control)
+
+    elif not 0 <= control < len(labels):
+        raise e.ValueError(f"`control` should be between 0 and {len(labels) - 1}")
+
+    others = np.array([i for i in range(len(labels)) if i != control], dtype=int)
+
+    if kernel is not None:
+        statistic, p = kernel(samples)(np.array([control]), others)
+        statistic, p = statistic[0], p[0]
+
+    elif n_jobs is None or n_jobs == 1:
+        outputs = [test(samples[control], samples[j]) for j in others]
+        statistic = np.array([output[0] for output in outputs], dtype=float)
+        p = np.array([output[1] for output in outputs], dtype=float)
+
+    else:
+        pairs = [(control, j) for j in others]
+        statistic, p = parallel.pairwise_map(test, samples, pairs, n_jobs)
+
+    if as_matrix:
+        h = calculate_hypotheses(p, alpha)
+
+        return ControlResult(
+            labels[control], np.asarray(labels)[others], statistic, p, h
+        )
+
     output = {}
 
-    for (attr, value) in dist.attrs:
-        for (attr2, value2) in dist.attrs:
-            if attr == attr2:
-                pass
+    for j, value in zip(others, p):
+        key = labels[control] + "-" + labels[j]
 
-            else:
-                key = attr + "-" + attr2
+        output[key] = (calculate_hypothesis(value, alpha), value)
 
-                _, p = test(value, value2)
-                h = calculate_hypothesis(p, alpha)
+    return output
+
+
+def pairwise_output(
+    labels: List[str],
+    statistic: np.ndarray,
+    p: np.ndarray,
+    alpha: float,
+    as_matrix: Optional[bool] = False,
+    h: Optional[np.ndarray] = None,
+) -> Union[Dict[str, Any], PairwiseResult]:
+    """Gathers the outputs of a pairwise test, calculating their hypotheses.
+
+    Args:
+        labels: Labels of the arguments.
+        statistic: Matrix of statistics.
+        p: Matrix of p-values.
+        alpha: Significance value.
+        as_matrix: Whether outputs should be dense matrices instead of a dictionary.
+        h: Matrix of hypotheses (calculated from `p` if not supplied).
+
+    Returns:
+        (Union[Dict[str, Any], PairwiseResult]): Test's outputs.
+
+    """
+
+    if as_matrix:
+        if h is None:
+            h = calculate_hypotheses(p, alpha)
+            np.fill_diagonal(h, 0)
+
+        return PairwiseResult(np.asarray(labels), statistic, p, h)
+
+    output = {}
+
+    for i, attr in enumerate(labels):
+        for j, attr2 in enumerate(labels):
+            if i != j:
+                key = attr + "-" + attr2
 
-                output[key] = (h, p)
+                output[key] = (calculate_hypothesis(p[i, j], alpha), p[i, j])
 
     return output
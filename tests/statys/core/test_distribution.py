@@ -1,7 +1,124 @@
-from statys.core.distribution import Distribution
+import numpy as np
+import pytest
+
+from statys.core.distribution import (
+    ColumnarDistribution,
+    Distribution,
+    StreamingDistribution,
+)
+from statys.tests import measure
+from statys.utils import exception
 
 
 def test_distribution():
     d = Distribution([0.1, 0.2])
 
     assert d.arg0 == [0.1, 0.2]
+
+
+def test_distribution_cache(tmp_path):
+    d = Distribution([0.1, 0.2])
+    d.enable_cache()
+
+    assert d.cache is not None
+    assert d.arg0.flags.writeable is False
+    assert [attr for attr, _ in d.attrs] == ["arg0"]
+
+    d.cache.put(np.mean, {}, {"arg0": 0.15})
+    d.arg0 = [0.3, 0.4]
+
+    assert len(d.cache) == 0
+
+    d.disable_cache()
+
+    assert d.cache is None
+
+    a = np.array([1.0, 3.0])
+    d = Distribution(a)
+    d.enable_cache()
+
+    assert measure.mean(d)["arg0"] == 2.0
+
+    a[0] = 100.0
+
+    assert measure.mean(d)["arg0"] == 2.0
+
+    d.arg0 = a
+
+    assert measure.mean(d)["arg0"] == 51.5
+
+    np.save(tmp_path / "x.npy", a)
+    d = Distribution.from_npy(str(tmp_path / "x.npy"), mmap=True)
+    d.enable_cache()
+
+    assert isinstance(d.arg0, np.memmap)
+
+
+def test_distribution_from_npy(tmp_path):
+    np.save(tmp_path / "x.npy", np.array([0.1, 0.2]))
+    np.save(tmp_path / "y.npy", np.array([0.3, 0.4, 0.5]))
+
+    d = Distribution.from_npy([str(tmp_path / "x.npy"), str(tmp_path / "y.npy")])
+
+    assert isinstance(d.arg0, np.memmap)
+    assert list(d.arg1) == [0.3, 0.4, 0.5]
+
+
+def test_distribution_from_npz(tmp_path):
+    np.savez(tmp_path / "x.npz", np.array([0.1, 0.2]), np.array([[1, 2], [3, 4]]))
+    np.savez_compressed(tmp_path / "y.npz", z=np.array([0.5]))
+
+    d = Distribution.from_npz(str(tmp_path / "x.npz"))
+
+    assert isinstance(d.arg0, np.memmap)
+    assert list(d.arg0) == [0.1, 0.2]
+    assert d.arg1[1, 0] == 3
+
+    d = Distribution.from_npz(str(tmp_path / "y.npz"), keys=["z"])
+
+    assert not isinstance(d.arg0, np.memmap)
+    assert d.arg0[0] == 0.5
+
+
+def test_columnar_distribution():
+    d = ColumnarDistribution([0.1, 0.2], [0.3, 0.4])
+
+    assert d.data.shape == (2, 2)
+    assert d.offsets is None
+    assert d.is_ragged is False
+    assert len(d) == 2
+    assert d.arg1[0] == 0.3
+    assert np.shares_memory(d.arg0, d.data)
+
+    with pytest.raises(AttributeError):
+        d.foo = 1
+
+
+def test_columnar_distribution_ragged():
+    d = ColumnarDistribution([0.1, 0.2], [0.3, 0.4, 0.5])
+
+    assert d.data.shape == (5,)
+    assert list(d.offsets) == [0, 2, 5]
+    assert d.is_ragged is True
+    assert list(d.arg1) == [0.3, 0.4, 0.5]
+    assert np.shares_memory(d[1], d.data)
+    assert [attr for attr, _ in d.attrs] == ["arg0", "arg1"]
+
+
+def test_streaming_distribution():
+    d = StreamingDistribution([0.1, 0.2], n_args=2)
+
+    d.append(0, 0.3)
+    d.append(1, [0.4, 0.5])
+
+    assert len(d) == 2
+    assert d.moments[0][1].n == 3
+    assert list(dict(d.attrs)["arg0"]) == [0.1, 0.2, 0.3]
+
+    with pytest.raises(exception.ValueError):
+        d.append(2, 0.1)
+
+    d = StreamingDistribution([0.1, 0.2], keep_values=False)
+
+    with pytest.raises(exception.ValueError):
+        d.attrs
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+import scipy.stats as s
+
+from statys.core import Distribution, pairwise
+from statys.tests import mann_whitney
+from statys.utils import exception
+
+
+def test_incremental_pairwise():
+    rng = np.random.default_rng(0)
+    values = [rng.normal(size=20) for _ in range(5)]
+    d = Distribution(*values)
+
+    incremental = pairwise.IncrementalPairwise(
+        s.mannwhitneyu, symmetric=True, mirror=mann_whitney.mirror_u, capacity=2
+    )
+
+    for value in values[:4]:
+        incremental.add(value)
+
+    assert incremental.capacity == 4
+
+    incremental.add(values[4])
+
+    assert incremental.capacity == 8
+
+    output = incremental.result()
+    reference = mann_whitney.u_test(d, as_matrix=True)
+
+    assert np.allclose(output.statistic, reference.statistic, equal_nan=True)
+    assert np.allclose(output.p, reference.p, equal_nan=True)
+
+    incremental.remove("arg1")
+    output = incremental.result()
+
+    assert list(output.labels) == ["arg0", "arg2", "arg3", "arg4"]
+    assert np.allclose(
+        output.p, reference.p[np.ix_([0, 2, 3, 4], [0, 2, 3, 4])], equal_nan=True
+    )
+    assert incremental.add(values[1]) == "arg5"
+
+    with pytest.raises(exception.ValueError):
+        incremental.add(values[1], "arg0")
+
+
+def test_incremental_pairwise_from_distribution():
+    d = Distribution([0.1, 0.2, 0.3], [0.3, 0.4, 0.5])
+
+    incremental = pairwise.IncrementalPairwise.from_distribution(d, s.ranksums)
+
+    assert incremental.result().to_dict().keys() == {"arg0-arg1", "arg1-arg0"}
@@ -1,9 +1,14 @@
+import io
+
+import pytest
+
 from statys.core import Distribution
 from statys.plotters import critical
 from statys.tests import friedman
+from statys.utils import exception
 
 
-def test_plot_critical_difference():
+def test_plot_critical_difference(tmp_path):
     x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
     y = [0.07, 0.14, 0.72, 0.32, 0.59, 0.43]
 
@@ -11,4 +16,77 @@ def test_plot_critical_difference():
 
     friedman_nemenyi = friedman.friedman_with_posthoc(d)
 
-    critical.plot_critical_difference(friedman_nemenyi)
+    critical.plot_critical_difference(
+        friedman_nemenyi, file=str(tmp_path / "cd_{key}.pdf")
+    )
+
+    assert (tmp_path / "cd_arg0.pdf").exists()
+
+
+def test_get_amount_lines():
+    ranks = [1.0, 1.5, 2.0, 3.5, 3.6, 5.0]
+
+    assert critical._get_amount_lines(ranks, 1.0) == [(0, 2), (3, 4)]
+    assert critical._get_amount_lines(ranks[::-1], 1.5) == [(0, 2), (2, 3), (3, 5)]
+    assert critical._get_amount_lines(ranks, 0.2) == [(3, 4)]
+
+
+def test_plot_critical_difference_in_memory(tmp_path):
+    x = [[0, 0.1, 0.2, 0.3], [0.1, 0, 0.3, 0.2]]
+    y = [[0.3, 0.1, 0.2, 0.0], [0.3, 0.2, 0.1, 0.0]]
+
+    d = Distribution(x, y)
+
+    friedman_nemenyi = friedman.friedman_with_posthoc(d, axis=1)
+
+    figures = critical.plot_critical_difference(friedman_nemenyi, save=False)
+
+    assert list(figures.keys()) == ["arg0", "arg1"]
+
+    buffer = io.BytesIO()
+    critical.plot_critical_difference(
+        {"arg0": friedman_nemenyi["arg0"]}, file=buffer, fmt="svg"
+    )
+
+    assert buffer.getvalue().lstrip().startswith(b"<?xml")
+
+    buffer = io.BytesIO()
+    critical.plot_critical_difference(friedman_nemenyi, file=buffer, multipage=True)
+
+    assert buffer.getvalue().startswith(b"%PDF")
+
+    critical.plot_critical_difference(
+        friedman_nemenyi, file=str(tmp_path / "cd_{key}.png"), fmt="png"
+    )
+
+    assert (tmp_path / "cd_arg1.png").exists()
+
+    with pytest.raises(exception.ValueError):
+        critical.plot_critical_difference(
+            friedman_nemenyi, file=str(tmp_path / "cd.png"), fmt="png"
+        )
+
+    with pytest.raises(exception.ValueError):
+        critical.render_critical_difference(
+            friedman_nemenyi, file=str(tmp_path / "cd.png"), fmt="png", n_jobs=1
+        )
+
+
+def test_render_critical_difference(tmp_path):
+    x = [[0, 0.1, 0.2, 0.3], [0.1, 0, 0.3, 0.2]]
+    y = [[0.3, 0.1, 0.2, 0.0], [0.3, 0.2, 0.1, 0.0]]
+
+    d = Distribution(x, y)
+
+    friedman_nemenyi = friedman.friedman_with_posthoc(d, axis=1)
+
+    output = critical.render_critical_difference(
+        friedman_nemenyi, file=str(tmp_path / "cd_{key}.png"), fmt="png", n_jobs=2
+    )
+    reference = critical.render_critical_difference(
+        friedman_nemenyi, fmt="png", n_jobs=None
+    )
+
+    assert list(output.keys()) == ["arg0", "arg1"]
+    assert output == reference
+    assert (tmp_path / "cd_arg0.png").read_bytes() == output["arg0"]
@@ -0,0 +1,25 @@
+import numpy as np
+
+from statys.plotters import layout
+
+
+def test_critical_difference_layout():
+    ranks = np.array([1.0, 1.5, 2.0, 3.5])
+
+    output = layout.critical_difference_layout(ranks, 1.0, labels=["a", "b", "c", "d"])
+
+    assert output.segments.shape[1:] == (2, 2)
+    assert output.segments.shape[0] == output.linewidths.shape[0]
+    assert np.sum(output.linewidths == 2.5) == 1
+    assert output.texts.shape[0] == output.text_positions.shape[0] == 4 + 4 + 1
+    assert list(output.texts[4:8]) == ["a", "b", "c", "d"]
+    assert output.texts[-1] == "CD=1.0"
+
+    reversed_output = layout.critical_difference_layout(ranks, 1.0, reverse=True)
+
+    assert list(reversed_output.texts[4:8]) == [
+        "$x_{3}$",
+        "$x_{2}$",
+        "$x_{1}$",
+        "$x_{0}$",
+    ]
@@ -0,0 +1,61 @@
+import io
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+
+from statys.core import Distribution
+from statys.plotters import svg
+from statys.tests import friedman, wilcoxon
+from statys.utils import exception
+
+
+def test_color_map():
+    assert svg._color_map([0.0, 1.0]) == ["#ffffcc", "#800026"]
+
+
+def test_plot_critical_difference(tmp_path):
+    x = [[0, 0.1, 0.2, 0.3], [0.1, 0, 0.3, 0.2]]
+    d = Distribution(x)
+
+    friedman_nemenyi = friedman.friedman_with_posthoc(d, axis=1)
+
+    output = svg.plot_critical_difference(
+        friedman_nemenyi, file=str(tmp_path / "cd_{key}.svg")
+    )
+
+    root = ET.fromstring(output["arg0"].split("\n", 1)[1])
+
+    assert root.tag.endswith("svg")
+    assert len(root.findall(".//{http://www.w3.org/2000/svg}line")) > 0
+    assert (tmp_path / "cd_arg0.svg").read_text() == output["arg0"]
+
+    with pytest.raises(exception.ValueError):
+        svg.plot_critical_difference(
+            {"a": friedman_nemenyi["arg0"], "b": friedman_nemenyi["arg0"]},
+            file=str(tmp_path / "cd.svg"),
+        )
+
+
+def test_plot_significance():
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    y = [0.07, 0.14, 0.72, 0.32, 0.59, 0.43]
+    z = [2.17, 9.14, 999.72, 8.32, 7.19, 9.43]
+
+    d = Distribution(x, y, z)
+
+    signed_rank = wilcoxon.signed_rank(d, as_matrix=True)
+
+    buffer = io.StringIO()
+    output = svg.plot_p_value(signed_rank, title="p-values", file=buffer)
+
+    assert buffer.getvalue() == output
+    assert "1.000" in output
+
+    output = svg.plot_h_index(np.array([[0, 1], [1, 0]]), labels=["a", "b"])
+    root = ET.fromstring(output.split("\n", 1)[1])
+
+    assert len(root.findall("{http://www.w3.org/2000/svg}rect")) == 1 + 4
+
+    with pytest.raises(exception.ValueError):
+        svg.plot_h_index(np.zeros((2, 2)), color_map="viridis")
@@ -1,5 +1,9 @@
+import numpy as np
+import pytest
+
 from statys.core import Distribution
 from statys.tests import friedman
+from statys.utils import exception
 
 
 def test_friedman():
@@ -19,3 +23,123 @@ def test_friedman_with_posthoc():
 
     assert len(output["arg0"][0]) == 6
     assert output["arg0"][1] == 5.331310596344878
+
+
+def test_friedman_doubled(monkeypatch):
+    x = [[0.3, 0.1, 0.2, 0.0], [0.3, 0.2, 0.1, 0.0], [0.1, 0.3, 0.2, 0.0]]
+    d = Distribution(x)
+
+    assert friedman.friedman(d, axis=1, doubled=True) == friedman.friedman(d, axis=1)
+
+    output = friedman.friedman_with_posthoc(d, axis=1, doubled=True)
+
+    assert np.allclose(output["arg0"][0], [3.333333, 3.0, 2.666667, 1.0])
+
+    for post_hoc in ("nemenyi", "conover"):
+        output = friedman.friedman_posthoc(d, post_hoc=post_hoc, axis=1, doubled=True)
+        reference = friedman.friedman_posthoc(d, post_hoc=post_hoc, axis=1)
+
+        assert np.allclose(output["arg0"].p, reference["arg0"].p, equal_nan=True)
+
+    dtypes = []
+    rank = friedman.m.rank
+
+    def _rank(*args, **kwargs):
+        output = rank(*args, **kwargs)
+        dtypes.append(output["arg0"].dtype)
+
+        return output
+
+    monkeypatch.setattr(friedman.m, "rank", _rank)
+    friedman.friedman(d, axis=1, doubled=True)
+
+    # Ranks are kept as int32 doubled ranks, i.e., the memory saving reaches Friedman
+    assert dtypes == [np.int32]
+
+
+def test_friedman_cache():
+    x = [[0, 0.1, 0.2, 0.3, 0.4, 0.5], [0, 0.1, 0.2, 0.3, 0.4, 0.5]]
+    d = Distribution(x)
+    d.enable_cache()
+
+    friedman.friedman(d, axis=1)
+    friedman.friedman_with_posthoc(d, axis=1)
+
+    assert d.cache.hits == 1
+    assert d.cache.misses == 1
+
+
+def test_friedman_batch():
+    x = [[0, 0.1, 0.2, 0.3, 0.4, 0.5], [0, 0.1, 0.2, 0.3, 0.4, 0.5]]
+
+    output = friedman.friedman_batch([x, x[::-1]])
+    reference = friedman.friedman(Distribution(x), axis=1)
+
+    assert output.statistic.shape == (2,)
+    assert np.isclose(output.statistic[0], reference["arg0"][0][0])
+    assert np.isclose(output.iman[1], reference["arg0"][1][0])
+    assert tuple(output.f_dist[0]) == reference["arg0"][1][1]
+
+
+def test_friedman_with_posthoc_alpha():
+    x = [[0, 0.1, 0.2, 0.3, 0.4, 0.5], [0, 0.1, 0.2, 0.3, 0.4, 0.5]]
+    d = Distribution(x)
+
+    output = friedman.friedman_with_posthoc(d, alpha=0.025, axis=1)
+    reference = friedman.friedman_with_posthoc(d, alpha=0.05, axis=1)
+
+    assert output["arg0"][1] > reference["arg0"][1]
+
+
+def test_friedman_posthoc():
+    x = [[0, 0.1, 0.2, 0.3], [0.1, 0, 0.3, 0.2], [0, 0.2, 0.1, 0.3]]
+    d = Distribution(x)
+
+    output = friedman.friedman_posthoc(d, axis=1)["arg0"]
+
+    assert output.p.shape == (4, 4)
+    assert np.isnan(output.p[0, 0])
+    assert np.allclose(output.statistic, -output.statistic.T, equal_nan=True)
+
+    output = friedman.friedman_posthoc(d, post_hoc="conover", axis=1)["arg0"]
+
+    assert output.p[0, 3] < output.p[0, 1]
+
+    output = friedman.friedman_posthoc(
+        d, post_hoc="bonferroni-dunn", control=3, axis=1
+    )["arg0"]
+
+    assert output.control == "3"
+    assert list(output.labels) == ["0", "1", "2"]
+
+    with pytest.raises(exception.ValueError):
+        friedman.friedman_posthoc(d, post_hoc="bonferroni-dunn", axis=1)
+
+
+def test_incremental_friedman():
+    x = [[0, 0.1, 0.2, 0.3], [0.1, 0, 0.3, 0.2], [0, 0.2, 0.1, 0.3]]
+    d = Distribution(x)
+
+    incremental = friedman.IncrementalFriedman()
+    incremental.update(x[:2]).update(x[2])
+
+    reference = friedman.friedman(d, axis=1)["arg0"]
+
+    assert incremental.n == 3
+    assert np.isclose(incremental.statistics()[0][0], reference[0][0])
+    assert np.isclose(incremental.statistics()[1][0], reference[1][0])
+    assert np.isclose(
+        incremental.critical_difference(),
+        friedman.friedman_with_posthoc(d, axis=1)["arg0"][1],
+    )
+
+    with pytest.raises(exception.SizeError):
+        incremental.update([[0, 1]])
+
+    incremental = friedman.IncrementalFriedman()
+
+    with pytest.raises(exception.SizeError):
+        incremental.update(np.zeros((2, 2, 4)))
+
+    assert incremental.k is None
+    assert incremental.update(x).n == 3
@@ -1,3 +1,5 @@
+import numpy as np
+
 from statys.core import Distribution
 from statys.tests import mann_whitney
 
@@ -13,3 +15,55 @@ def test_u_test():
         0,
         0.3939393939393939,
     )
+
+
+def test_u_test_processes():
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    y = [0.07, 0.14, 0.72, 0.32, 0.59, 0.43, 0.11]
+    d = Distribution(x, y)
+
+    output = mann_whitney.u_test(d, as_matrix=True, n_jobs=2)
+    reference = mann_whitney.u_test(d, as_matrix=True)
+
+    assert np.allclose(output.p, reference.p, equal_nan=True)
+    assert np.allclose(output.statistic, reference.statistic, equal_nan=True)
+
+
+def test_u_test_serial(monkeypatch):
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    y = [0.07, 0.14, 0.72, 0.32, 0.59, 0.43, 0.11]
+    d = Distribution(x, y)
+
+    kernels = []
+    pipeline = mann_whitney.w.statistical_pipeline
+
+    def _pipeline(*args, **kwargs):
+        kernels.append(kwargs["kernel"])
+
+        return pipeline(*args, **kwargs)
+
+    monkeypatch.setattr(mann_whitney.w, "statistical_pipeline", _pipeline)
+
+    mann_whitney.u_test(d, n_jobs=1)
+
+    # A single job keeps the vectorized kernel, as serial runs do by default
+    assert kernels == [mann_whitney.k.MannWhitneyKernel]
+
+
+def test_u_test_control():
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    y = [0.07, 0.14, 0.72, 0.32, 0.59, 0.43]
+    z = [0.9, 0.8, 0.7, 0.6, 0.5, 0.4]
+    d = Distribution(x, y, z)
+
+    output = mann_whitney.u_test(d, as_matrix=True, control="arg1")
+    reference = mann_whitney.u_test(d, as_matrix=True)
+
+    assert output.control == "arg1"
+    assert list(output.labels) == ["arg0", "arg2"]
+    assert np.allclose(output.statistic, reference.statistic[1, [0, 2]])
+    assert np.allclose(output.p, reference.p[1, [0, 2]])
+
+    output = mann_whitney.u_test(d, control=0, n_jobs=2)
+
+    assert list(output.keys()) == ["arg0-arg1", "arg0-arg2"]
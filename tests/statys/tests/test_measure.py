@@ -1,4 +1,7 @@
-from statys.core import Distribution
+import numpy as np
+import scipy.stats as s
+
+from statys.core import Distribution, StreamingDistribution
 from statys.tests import measure
 
 
@@ -81,3 +84,72 @@ def test_var():
     output = measure.var(d)
 
     assert output["arg0"] == 0.029166666666666664
+
+
+def test_streamed_measures(tmp_path):
+    x = np.random.default_rng(0).normal(size=1000)
+    np.save(tmp_path / "x.npy", x)
+
+    d = Distribution.from_npy(str(tmp_path / "x.npy"))
+
+    assert np.isclose(measure.mean(d)["arg0"], np.mean(x))
+    assert np.isclose(measure.std(d, ddof=1)["arg0"], np.std(x, ddof=1))
+    assert np.isclose(measure.skewness(d)["arg0"], s.skew(x))
+    assert np.isclose(measure.kurtosis(d, axis=0)["arg0"], s.kurtosis(x))
+    assert measure.max(d)["arg0"] == np.max(x)
+
+
+def test_streaming_measures():
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    d = StreamingDistribution(x[:3], keep_values=False)
+    d.append(0, x[3:])
+
+    assert np.isclose(measure.mean(d)["arg0"], 0.25)
+    assert np.isclose(measure.var(d)["arg0"], 0.029166666666666664)
+    assert np.isclose(measure.kurtosis(d)["arg0"], -1.268571428571428)
+    assert measure.min(d)["arg0"] == 0
+
+
+def test_describe(tmp_path):
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    y = [0.07, 0.14, 0.72, 0.32, 0.59]
+    d = Distribution(x, y)
+
+    output = measure.describe(d)
+
+    assert output["arg0"].n == 6
+    assert np.isclose(output["arg0"].median, 0.25)
+    assert np.isclose(output["arg0"].kurtosis, -1.268571428571428)
+    assert np.isclose(output["arg1"].median, 0.32)
+    assert np.isclose(output["arg1"].std, np.std(y))
+    assert np.isclose(output["arg1"].skewness, s.skew(y))
+
+    np.save(tmp_path / "x.npy", np.array(x))
+    d = Distribution.from_npy(str(tmp_path / "x.npy"), mmap=True)
+
+    output = measure.describe(d)
+
+    assert np.isnan(output["arg0"].median)
+    assert np.isclose(output["arg0"].mean, 0.25)
+
+    d = StreamingDistribution(x, keep_values=False)
+
+    output = measure.describe(d)
+
+    assert np.isnan(output["arg0"].median)
+    assert np.isclose(output["arg0"].mean, 0.25)
+
+
+def test_measures_threads():
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    y = [0.07, 0.14, 0.72, 0.32, 0.59, 0.43]
+    d = Distribution(x, y)
+
+    output = measure.mean(d, n_jobs=2)
+
+    assert list(output.keys()) == ["arg0", "arg1"]
+    assert output["arg0"] == 0.25
+
+    output = measure.describe(d, n_jobs=-1)
+
+    assert output["arg1"].max == 0.72
@@ -20,3 +20,29 @@ def test_rank_sum():
     output = wilcoxon.rank_sum(d)
 
     assert output["arg0-arg1"] == (0, 0.3366683676100388)
+
+
+def test_rank_sum_matrix():
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    y = [0.07, 0.14, 0.72, 0.32, 0.59, 0.43]
+    d = Distribution(x, y)
+
+    output = wilcoxon.rank_sum(d, as_matrix=True)
+
+    assert output.p.shape == (2, 2)
+    assert output.p[1, 0] == 0.3366683676100388
+    assert output.statistic[0, 1] == -output.statistic[1, 0]
+
+
+def test_signed_rank_control():
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    y = [0.07, 0.14, 0.72, 0.32, 0.59, 0.43]
+    z = [0.9, 0.8, 0.7, 0.6, 0.5, 0.4]
+    d = Distribution(x, y, z)
+
+    output = wilcoxon.signed_rank(d, as_matrix=True, control="arg0")
+    reference = wilcoxon.signed_rank(d, as_matrix=True)
+
+    assert output.p.shape == (2,)
+    assert output.p[1] == reference.p[0, 2]
+    assert output.to_dict()["arg0-arg1"] == (0, reference.p[0, 1])
@@ -0,0 +1,44 @@
+import numpy as np
+
+from statys.utils import cache
+
+
+def test_measure_cache():
+    c = cache.MeasureCache(max_entries=2)
+
+    assert c.get(np.mean, {}) is None
+
+    c.put(np.mean, {}, {"arg0": 1.0})
+    c.put(np.std, {"ddof": 1}, {"arg0": 2.0})
+
+    assert c.get(np.mean, {}) == {"arg0": 1.0}
+    assert c.get(np.std, {"ddof": 1}) == {"arg0": 2.0}
+    assert c.hits == 2
+
+    c.put(np.var, {}, {"arg0": 3.0})
+
+    assert len(c) == 2
+    assert c.get(np.mean, {}) is None
+
+    c.clear()
+
+    assert len(c) == 0
+    assert c.nbytes == 0
+
+
+def test_measure_cache_memory():
+    c = cache.MeasureCache(max_bytes=100)
+
+    c.put(np.sort, {}, {"arg0": np.zeros(100)})
+
+    assert len(c) == 0
+
+    c.put(np.sort, {"axis": [0]}, {"arg0": 1.0})
+
+    assert len(c) == 0
+
+    x = np.zeros(5)
+    c.put(np.sort, {}, {"arg0": x})
+
+    assert len(c) == 1
+    assert x.flags.writeable is False
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from statys.utils import constants, critical_values, exception
+
+
+def test_critical_value():
+    assert critical_values.critical_value(1) == 0
+    assert (
+        critical_values.critical_value(5, 0.05)
+        == constants.CRITICAL_VALUES["nemenyi"][4][1]
+    )
+    assert np.isclose(critical_values.critical_value(5, 0.01), 3.254685942)
+    assert np.isclose(critical_values.critical_value(5, 0.025), 2.9677, atol=1e-3)
+    assert critical_values.critical_value(150, 0.05) > critical_values.critical_value(
+        100, 0.05
+    )
+
+    with pytest.raises(exception.ValueError):
+        critical_values.critical_value(5, 0.05, "unknown")
+
+
+def test_critical_value_bonferroni_dunn():
+    assert np.isclose(
+        critical_values.critical_value(2, 0.05, "bonferroni-dunn"), 1.96, atol=1e-3
+    )
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+import scipy.stats as s
+
+from statys.utils import exception, kernels
+
+
+def test_mann_whitney_kernel():
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    y = [0.07, 0.14, 0.72, 0.32, 0.59, 0.43]
+    z = np.round(np.linspace(0, 1, 20), 1)
+    w = np.round(np.linspace(0.2, 1.5, 25), 1)
+
+    index = np.arange(4)
+    u, p = kernels.MannWhitneyKernel([x, y, z, w])(index, index)
+
+    assert np.isnan(u[0, 0])
+    assert u[0, 1] == s.mannwhitneyu(x, y)[0]
+    assert np.isclose(p[0, 1], s.mannwhitneyu(x, y)[1])
+    assert u[3, 2] == s.mannwhitneyu(w, z)[0]
+    assert np.isclose(p[2, 3], s.mannwhitneyu(z, w)[1])
+    assert np.isclose(p[3, 1], s.mannwhitneyu(w, y)[1])
+
+
+def test_rank_sum_kernel():
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    y = [0.07, 0.14, 0.72, 0.32, 0.59, 0.43, 0.1]
+
+    z, p = kernels.RankSumKernel([x, y])(np.array([1]), np.array([0, 1]))
+
+    assert z.shape == (1, 2)
+    assert np.isclose(z[0, 0], s.ranksums(y, x)[0])
+    assert np.isclose(p[0, 0], s.ranksums(y, x)[1])
+
+
+def test_signed_rank_kernel():
+    rng = np.random.default_rng(0)
+    x = np.round(rng.normal(size=60), 1)
+    y = np.round(rng.normal(size=60), 1)
+    z = np.round(rng.normal(size=60), 1)
+
+    index = np.arange(3)
+    statistic, p = kernels.SignedRankKernel([x, y, z], chunk_size=60)(index, index)
+
+    assert np.isnan(p[1, 1])
+    assert statistic[0, 1] == statistic[1, 0] == s.wilcoxon(x, y)[0]
+    assert np.isclose(p[2, 0], s.wilcoxon(z, x)[1])
+
+    with pytest.raises(exception.SizeError):
+        kernels.SignedRankKernel([x, y[:10]])
+
+
+def test_kernel_nan():
+    x = np.linspace(0, 1, 30)
+    y = np.linspace(0.2, 1.5, 30)
+    z = x.copy()
+    z[3] = np.nan
+
+    index = np.arange(3)
+
+    for kernel, test in (
+        (kernels.MannWhitneyKernel, s.mannwhitneyu),
+        (kernels.RankSumKernel, s.ranksums),
+    ):
+        statistic, p = kernel([x, y, z])(index, index)
+
+        assert np.isnan(test(z, x)[1])
+        assert np.all(np.isnan(statistic[2])) and np.all(np.isnan(p[:, 2]))
+        assert np.isclose(p[0, 1], test(x, y)[1])
+
+
+def test_kernel_mirror():
+    rng = np.random.default_rng(0)
+    samples = [rng.normal(size=20), rng.normal(size=30), rng.normal(size=20)]
+
+    rows, cols = np.array([0]), np.array([1, 2])
+
+    for kernel in (kernels.MannWhitneyKernel, kernels.RankSumKernel):
+        k = kernel(samples)
+        statistic, _ = k(rows, cols)
+
+        assert np.allclose(k.mirror(statistic, rows, cols), k(cols, rows)[0])
@@ -0,0 +1,48 @@
+import numpy as np
+import scipy.stats as s
+
+from statys.utils.moments import Moments
+
+
+def test_moments_from_array():
+    x = np.array([0, 0.1, 0.2, 0.3, 0.4, 0.5])
+
+    m = Moments.from_array(x)
+
+    assert m.n == 6
+    assert np.isclose(m.mean(), np.mean(x))
+    assert np.isclose(m.var(), np.var(x))
+    assert np.isclose(m.std(ddof=1), np.std(x, ddof=1))
+    assert np.isclose(m.min(), 0)
+    assert np.isclose(m.max(), 0.5)
+
+
+def test_moments_from_chunks():
+    x = np.random.default_rng(0).exponential(size=1001)
+
+    m = Moments.from_chunks(x, chunk_size=100)
+
+    assert m.n == 1001
+    assert np.isclose(m.mean(), np.mean(x))
+    assert np.isclose(m.var(), np.var(x))
+    assert np.isclose(m.skewness(), s.skew(x))
+    assert np.isclose(m.skewness(bias=False), s.skew(x, bias=False))
+    assert np.isclose(m.kurtosis(), s.kurtosis(x))
+    assert np.isclose(
+        m.kurtosis(fisher=False, bias=False), s.kurtosis(x, fisher=False, bias=False)
+    )
+
+
+def test_moments_merge():
+    m = Moments()
+    m.merge(Moments())
+
+    assert m.n == 0
+    assert np.isnan(m.mean())
+
+    m.update([1, 2, 3])
+    m.update([4])
+
+    assert m.n == 4
+    assert np.isclose(m.mean(), 2.5)
+    assert m.max() == 4
@@ -0,0 +1,30 @@
+import numpy as np
+import scipy.stats as s
+
+from statys.utils import parallel
+
+
+def test_shared_samples():
+    with parallel.SharedSamples([[0.1, 0.2], [0.3, 0.4, 0.5]]) as shared:
+        assert shared.name is not None
+        assert list(shared.offsets) == [0, 2, 5]
+
+
+def test_pairwise_map():
+    x = [0, 0.1, 0.2, 0.3, 0.4, 0.5]
+    y = [0.07, 0.14, 0.72, 0.32, 0.59, 0.43]
+    z = [2.17, 9.14, 999.72, 8.32, 7.19, 9.43]
+
+    pairs = [(0, 1), (0, 2), (2, 1)]
+
+    for start_method in ["fork", "spawn"]:
+        statistic, p = parallel.pairwise_map(
+            s.ranksums, [x, y, z], pairs, n_jobs=2, start_method=start_method
+        )
+
+        assert np.isclose(statistic[2], s.ranksums(z, y)[0])
+        assert np.isclose(p[0], s.ranksums(x, y)[1])
+
+    statistic, p = parallel.pairwise_map(s.ranksums, [x, y], [], n_jobs=2)
+
+    assert statistic.shape == (0,)
@@ -0,0 +1,20 @@
+import numpy as np
+import scipy.stats as s
+
+from statys.utils import ranks
+
+
+def test_rankdata():
+    x = np.array([[0.3, 0.1, 0.3, 0.2], [0.1, 0.1, 0.1, 0.4], [0.2, np.nan, 0.1, 0.3]])
+
+    output = ranks.rankdata(x[:2], axis=1)
+
+    assert np.array_equal(output, s.rankdata(x[:2], axis=1))
+    assert np.array_equal(ranks.rankdata(x[:2]), s.rankdata(x[:2]))
+    assert np.all(np.isnan(ranks.rankdata(x, axis=1)[2]))
+
+    out = np.empty((2, 4), dtype=np.int32)
+    doubled = ranks.rankdata(x[:2], axis=0, out=out, doubled=True)
+
+    assert doubled is out
+    assert np.array_equal(doubled / 2, s.rankdata(x[:2], axis=0))
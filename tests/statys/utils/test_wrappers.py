@@ -1,5 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import scipy.stats as s
+
 from statys.core import Distribution
-from statys.utils import wrappers
+from statys.tests import mann_whitney
+from statys.utils import exception, wrappers
 
 
 def test_calculate_hypothesis():
@@ -11,6 +18,20 @@ def test_calculate_hypothesis():
     assert h == 0
 
 
+def test_parallel_map():
+    def f(x):
+        return x * 2
+
+    assert wrappers.parallel_map(f, [1, 2, 3]) == [2, 4, 6]
+    assert wrappers.parallel_map(f, [1, 2, 3], n_jobs=2) == [2, 4, 6]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert wrappers.parallel_map(f, [1, 2, 3], executor=executor) == [2, 4, 6]
+
+    with pytest.raises(exception.ValueError):
+        wrappers.parallel_map(f, [1, 2, 3], n_jobs=-2)
+
+
 def test_measure_pipeline():
     def f(x):
         return True
@@ -22,6 +43,25 @@ def test_measure_pipeline():
     assert output["arg0"] is True
 
 
+def test_measure_pipeline_cache():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+
+        return len(calls)
+
+    d = Distribution([0.1, 0.2])
+    d.enable_cache()
+
+    assert wrappers.measure_pipeline(f, d)["arg0"] == 1
+    assert wrappers.measure_pipeline(f, d)["arg0"] == 1
+
+    d.arg0 = [0.3]
+
+    assert wrappers.measure_pipeline(f, d)["arg0"] == 2
+
+
 def test_statistical_pipeline():
     def f(x, y):
         return [0, 0]
@@ -32,3 +72,138 @@ def test_statistical_pipeline():
     output = wrappers.statistical_pipeline(f, d, alpha)
 
     assert output["arg0-arg1"] == (1, 0)
+
+
+def test_statistical_pipeline_symmetric():
+    calls = []
+
+    def f(x, y):
+        calls.append((x, y))
+
+        return [0, 0.1]
+
+    d = Distribution([0.1, 0.2], [0.3, 0.4], [0.5, 0.6])
+    alpha = 0.05
+
+    output = wrappers.statistical_pipeline(f, d, alpha, symmetric=True)
+
+    assert len(calls) == 3
+    assert len(output) == 6
+    assert output["arg2-arg0"] == output["arg0-arg2"] == (0, 0.1)
+
+
+def test_statistical_pipeline_kernel():
+    def kernel(samples):
+        def f(rows, cols):
+            return np.zeros((len(rows), len(cols))), np.full(
+                (len(rows), len(cols)), 0.1
+            )
+
+        return f
+
+    d = Distribution([0.1, 0.2], [0.3, 0.4])
+    alpha = 0.05
+
+    output = wrappers.statistical_pipeline(None, d, alpha, kernel=kernel)
+
+    assert output == {"arg0-arg1": (0, 0.1), "arg1-arg0": (0, 0.1)}
+
+
+def test_statistical_pipeline_matrix():
+    def f(x, y):
+        return [x[0] - y[0], 0.01]
+
+    def mirror(statistic, x, y):
+        return -statistic
+
+    d = Distribution([0.1, 0.2], [0.3, 0.4])
+    alpha = 0.05
+
+    output = wrappers.statistical_pipeline(
+        f, d, alpha, symmetric=True, mirror=mirror, as_matrix=True
+    )
+
+    assert list(output.labels) == ["arg0", "arg1"]
+    assert np.isclose(output.statistic[1, 0], 0.2)
+    assert output.h[0, 1] == 1
+    assert output.h[0, 0] == 0
+    assert output.to_dict() == {"arg0-arg1": (1, 0.01), "arg1-arg0": (1, 0.01)}
+
+    def g(x, y):
+        return [np.nan, np.nan if x[0] == 0.5 else 0.5]
+
+    d = Distribution([0.1], [0.5], [0.2])
+    output = wrappers.statistical_pipeline(g, d, alpha, as_matrix=True)
+    reference = wrappers.statistical_pipeline(g, d, alpha)
+
+    assert {k: v[0] for k, v in output.to_dict().items()} == {
+        k: v[0] for k, v in reference.items()
+    }
+    assert output.h[1, 0] == 1 and output.h[1, 1] == 0
+    assert [r[4] for r in wrappers.iter_pairs(g, d, alpha)] == list(
+        output.h[~np.eye(3, dtype=bool)]
+    )
+
+
+def test_statistical_pipeline_memory_budget(tmp_path):
+    def f(x, y):
+        return [x[0] - y[0], 0.01]
+
+    def mirror(statistic, x, y):
+        return -statistic
+
+    d = Distribution([0.1], [0.2], [0.3], [0.4], [0.5])
+    alpha = 0.05
+
+    output = wrappers.statistical_pipeline(
+        f, d, alpha, symmetric=True, mirror=mirror, as_matrix=True
+    )
+    tiled = wrappers.statistical_pipeline(
+        f,
+        d,
+        alpha,
+        symmetric=True,
+        mirror=mirror,
+        as_matrix=True,
+        memory_budget=200,
+        out=str(tmp_path),
+    )
+
+    assert np.allclose(tiled.statistic, output.statistic, equal_nan=True)
+    assert np.array_equal(tiled.h, output.h)
+    assert tiled.h.dtype == output.h.dtype
+    assert np.allclose(np.load(tmp_path / "p.npy"), output.p, equal_nan=True)
+
+    with pytest.raises(exception.ValueError):
+        wrappers.statistical_pipeline(f, d, alpha, memory_budget=0)
+
+
+def test_iter_pairs():
+    def f(x, y):
+        return [x[0] - y[0], 0.01 if x[0] > 0.2 else 0.5]
+
+    def mirror(statistic, x, y):
+        return -statistic
+
+    d = Distribution([0.1], [0.2], [0.3])
+    alpha = 0.05
+
+    records = list(wrappers.iter_pairs(f, d, alpha, symmetric=True, mirror=mirror))
+
+    assert len(records) == 6
+    assert records[0][:2] == (0, 1) and records[1][:2] == (1, 0)
+    assert np.isclose(records[1][2], 0.1)
+
+    records = list(wrappers.iter_pairs(f, d, alpha, stop=lambda r: r[4] == 1))
+
+    assert records[-1][:2] == (2, 0)
+    assert len(records) == 5
+
+    d = Distribution([0, 0.1, 0.2, 0.3], [0.07, 0.14, 0.72, 0.32, 0.59])
+    records = list(
+        wrappers.iter_pairs(
+            s.mannwhitneyu, d, alpha, symmetric=True, mirror=mann_whitney.mirror_u
+        )
+    )
+
+    assert records[1][2] == s.mannwhitneyu(d.arg1, d.arg0)[0]